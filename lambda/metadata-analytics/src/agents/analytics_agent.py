@@ -4,6 +4,7 @@ import json
 import logging
 from typing import Any, Dict, List
 
+from pydantic import BaseModel, Field
 from strands import Agent
 
 logger = logging.getLogger(__name__)
@@ -24,20 +25,11 @@ ANALYSIS REQUIREMENTS:
 - Provide actionable insights based on the data
 
 RESPONSE FORMAT:
-Return your analysis as a JSON object with the following structure:
-{
-  "executive_summary": "Brief overview of the key findings (2-3 sentences)",
-  "key_findings": [
-    "Finding 1: Specific, data-driven insight",
-    "Finding 2: Another specific insight",
-    ...
-  ],
-  "detailed_statistics": {
-    "summary": "Detailed explanation of statistics",
-    "notable_patterns": ["Pattern 1", "Pattern 2", ...],
-    "recommendations": ["Recommendation 1", "Recommendation 2", ...]
-  }
-}
+Return your analysis through the structured output tool, providing:
+- An executive summary: brief overview of the key findings (2-3 sentences)
+- Key findings: specific, data-driven insights
+- Detailed statistics: a detailed explanation of the statistics, notable patterns
+  and recommendations
 
 IMPORTANT:
 - Base your analysis ONLY on the provided data
@@ -48,6 +40,22 @@ IMPORTANT:
 """
 
 
+class DetailedStatistics(BaseModel):
+    """Detailed statistical insights returned by the agent."""
+
+    summary: str = Field(description="Detailed explanation of statistics")
+    notable_patterns: List[str] = Field(default_factory=list)
+    recommendations: List[str] = Field(default_factory=list)
+
+
+class AnalysisOutput(BaseModel):
+    """Structured analysis returned by the agent."""
+
+    executive_summary: str = Field(description="Brief overview of the key findings (2-3 sentences)")
+    key_findings: List[str] = Field(description="Specific, data-driven insights")
+    detailed_statistics: DetailedStatistics
+
+
 class MetadataAnalyticsAgent:
     """AI agent for metadata analytics using Strands Agents SDK."""
 
@@ -57,7 +65,7 @@ class MetadataAnalyticsAgent:
         Args:
             region: AWS region for Bedrock (not used anymore but kept for compatibility)
         """
-        logger.info(f"Initializing MetadataAnalyticsAgent in region: {region}")
+        logger.info("Initializing MetadataAnalyticsAgent in region: %s", region)
 
         # Create agent without tools - focusing on interpretation only
         self.agent = Agent(
@@ -75,7 +83,7 @@ class MetadataAnalyticsAgent:
 
         Args:
             statistics: Aggregated metadata statistics from collector
-            chart_info: List of chart information (title, description, file_path)
+            chart_info: List of chart information (title, chart_type, metadata_key, description)
 
         Returns:
             Analysis result with insights and chart information
@@ -89,22 +97,25 @@ class MetadataAnalyticsAgent:
             # Format statistics and chart info for the agent
             prompt = self._format_analysis_prompt(statistics, chart_info)
 
-            # Execute agent with statistics
+            # Execute agent with statistics; the answer comes back as a typed tool call
             logger.info("Executing Strands Agent for interpretation...")
-            response = self.agent(prompt)
+            # The agent lives across warm invocations; start each analysis without prior turns
+            self.agent.messages = []
+            result = self.agent(prompt, structured_output_model=AnalysisOutput)
+            analysis = result.structured_output
 
             logger.info("Agent execution completed")
 
-            # Parse agent response
-            result = self._parse_agent_response(response, statistics, chart_info)
-
-            # Add execution time
-            result["execution_time"] = time.time() - start_time
-
-            return result
+            return {
+                "executive_summary": analysis.executive_summary,
+                "key_findings": analysis.key_findings,
+                "detailed_statistics": analysis.detailed_statistics.model_dump(),
+                "charts": [chart["title"] for chart in (chart_info or [])],
+                "execution_time": time.time() - start_time,
+            }
 
         except Exception as e:
-            logger.error(f"Error during analysis: {e}", exc_info=True)
+            logger.error("Error during analysis: %s", e, exc_info=True)
             # Return fallback analysis if agent fails
             return self._create_fallback_analysis(statistics, chart_info)
 
@@ -150,99 +161,9 @@ Please analyze this data and provide:
 1. An executive summary highlighting the most important findings
 2. A list of key findings with specific data points
 3. Detailed statistical insights including notable patterns and recommendations
-
-Return your analysis as a JSON object following the specified format.
 """
         return prompt
 
-    def _parse_agent_response(
-        self,
-        response: str,
-        original_stats: Dict[str, Any],
-        chart_info: List[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
-        """Parse the agent's response.
-
-        Args:
-            response: Raw response from agent
-            original_stats: Original statistics for fallback
-            chart_info: Chart information
-
-        Returns:
-            Structured analysis result
-        """
-        try:
-            # Try to extract JSON from response
-            response_str = str(response)
-
-            # Look for JSON content
-            if "```json" in response_str:
-                json_start = response_str.find("```json") + 7
-                json_end = response_str.find("```", json_start)
-                json_content = response_str[json_start:json_end].strip()
-                analysis = json.loads(json_content)
-            elif "```" in response_str:
-                # Try without json marker
-                json_start = response_str.find("```") + 3
-                json_end = response_str.find("```", json_start)
-                json_content = response_str[json_start:json_end].strip()
-                analysis = json.loads(json_content)
-            else:
-                # Try parsing the entire response as JSON
-                analysis = json.loads(response_str)
-
-            # Ensure required fields exist
-            result = {
-                "executive_summary": analysis.get(
-                    "executive_summary", "Analysis completed successfully."
-                ),
-                "key_findings": analysis.get("key_findings", []),
-                "detailed_statistics": analysis.get("detailed_statistics", {}),
-                "charts": [
-                    chart["file_path"] for chart in (chart_info or [])
-                ],  # Use actual chart paths
-                "raw_response": response_str,
-                "execution_time": 0.0,  # Will be set by analyze() method
-            }
-
-            return result
-
-        except Exception as e:
-            logger.warning(f"Failed to parse agent response as JSON: {e}")
-            # Return response as-is with original stats
-            return {
-                "executive_summary": "Analysis completed. See raw response for details.",
-                "key_findings": self._extract_findings_from_text(str(response)),
-                "detailed_statistics": original_stats,
-                "charts": [chart["file_path"] for chart in (chart_info or [])],
-                "raw_response": str(response),
-                "execution_time": 0.0,  # Will be set by analyze() method
-            }
-
-    def _extract_findings_from_text(self, text: str) -> List[str]:
-        """Extract findings from unstructured text response.
-
-        Args:
-            text: Response text
-
-        Returns:
-            List of findings
-        """
-        findings = []
-        lines = text.split("\n")
-
-        for line in lines:
-            line = line.strip()
-            # Look for bullet points or numbered items
-            if line.startswith("-") or line.startswith("•"):
-                findings.append(line[1:].strip())
-            elif len(line) > 10 and any(
-                line.startswith(f"{i}.") for i in range(1, 20)
-            ):
-                findings.append(line.split(".", 1)[1].strip())
-
-        return findings[:10]  # Limit to 10 findings
-
     def _create_fallback_analysis(
         self, statistics: Dict[str, Any], chart_info: List[Dict[str, str]] = None
     ) -> Dict[str, Any]:
@@ -305,7 +226,7 @@ Return your analysis as a JSON object following the specified format.
                     "Review the generated charts for detailed distribution patterns"
                 ],
             },
-            "charts": [chart["file_path"] for chart in (chart_info or [])],
+            "charts": [chart["title"] for chart in (chart_info or [])],
             "raw_response": "Fallback analysis (agent execution failed)",
             "execution_time": 0.0,
         }
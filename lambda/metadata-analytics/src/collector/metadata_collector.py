@@ -2,10 +2,10 @@
 
 import logging
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Optional
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from typing import Any, Iterable, Iterator, List, Optional
 
-from ..utils.s3_operations import S3Operations
+from ..utils.s3_operations import S3ObjectInfo, S3Operations
 from .models import CollectionParams, CollectionResult, MetadataEntry
 
 logger = logging.getLogger(__name__)
@@ -33,29 +33,33 @@ class MetadataCollector:
         """
         start_time = time.time()
 
-        logger.info(f"Starting metadata collection from {params.bucket_name}")
-        logger.info(f"Date range: {params.start_date} to {params.end_date}")
-
-        # Step 1: List .metadata.json files from S3
-        metadata_files = list(
-            self.s3_ops.list_metadata_files(
-                bucket=params.bucket_name,
-                prefix=params.prefix,
-                start_date=params.start_date,
-                end_date=params.end_date,
-            )
+        logger.info("Starting metadata collection from %s", params.bucket_name)
+        logger.info("Date range: %s to %s", params.start_date, params.end_date)
+
+        # Step 1: List .metadata.json files from S3 (streamed page by page)
+        metadata_files = self.s3_ops.list_metadata_files(
+            bucket=params.bucket_name,
+            prefix=params.prefix,
+            start_date=params.start_date,
+            end_date=params.end_date,
         )
 
-        total_scanned = len(metadata_files)
-        logger.info(f"Found {total_scanned} metadata files")
+        # Count every listed file, but only hand max_results of them to the downloaders
+        total_scanned = 0
+
+        def files_to_download() -> Iterator[S3ObjectInfo]:
+            nonlocal total_scanned
+            for file_info in metadata_files:
+                total_scanned += 1
+                if not params.max_results or total_scanned <= params.max_results:
+                    yield file_info
 
-        # Apply max_results limit
-        if params.max_results and len(metadata_files) > params.max_results:
-            metadata_files = metadata_files[: params.max_results]
-            logger.info(f"Limited to {params.max_results} files")
+        # Step 2: Download and parse in parallel while listing continues
+        entries = self._download_and_parse_parallel(params.bucket_name, files_to_download(), params)
 
-        # Step 2: Download and parse in parallel
-        entries = self._download_and_parse_parallel(params.bucket_name, metadata_files, params)
+        logger.info("Found %d metadata files", total_scanned)
+        if params.max_results and total_scanned > params.max_results:
+            logger.info("Limited to %d files", params.max_results)
 
         # Step 3: Apply metadata filters
         filtered_entries = self._apply_filters(entries, params)
@@ -63,7 +67,7 @@ class MetadataCollector:
         execution_time = time.time() - start_time
         total_bytes = sum(e.file_size for e in filtered_entries)
 
-        logger.info(f"Collected {len(filtered_entries)} entries in {execution_time:.2f}s")
+        logger.info("Collected %d entries in %.2fs", len(filtered_entries), execution_time)
 
         return CollectionResult(
             entries=filtered_entries,
@@ -76,47 +80,67 @@ class MetadataCollector:
     def _download_and_parse_parallel(
         self,
         bucket: str,
-        files: List[dict],
+        files: Iterable[S3ObjectInfo],
         params: CollectionParams,
     ) -> List[MetadataEntry]:
         """Download and parse metadata files in parallel.
 
+        Files are consumed lazily, so downloads start while the listing is still
+        paging and at most a small window of pending downloads is held in memory.
+
         Args:
             bucket: S3 bucket name
-            files: List of file info dicts
+            files: Iterable of S3 listing records
             params: Collection parameters
 
         Returns:
             List of metadata entries
         """
         entries = []
+        max_in_flight = params.parallel_downloads * 4
 
-        with ThreadPoolExecutor(max_workers=params.parallel_downloads) as executor:
-            # Submit download tasks
-            future_to_file = {
-                executor.submit(self._download_and_parse_single, bucket, file_info): file_info
-                for file_info in files
-            }
-
-            # Collect results
-            for future in as_completed(future_to_file):
+        def collect_result(future: Future, file_info: S3ObjectInfo) -> None:
+            # A failed file is skipped, not fatal
+            try:
                 entry = future.result()
-                if entry:
-                    entries.append(entry)
+            except Exception as e:
+                logger.warning("Skipping s3://%s/%s: %s", bucket, file_info.key, e)
+                return
+            if entry:
+                entries.append(entry)
+
+        with ThreadPoolExecutor(max_workers=params.parallel_downloads) as executor:
+            in_flight = {}
+
+            # Submit download tasks, waiting for a slot when the window is full
+            for file_info in files:
+                if len(in_flight) >= max_in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect_result(future, in_flight.pop(future))
+
+                future = executor.submit(self._download_and_parse_single, bucket, file_info)
+                in_flight[future] = file_info
+
+            # Collect remaining results
+            for future in as_completed(in_flight):
+                collect_result(future, in_flight[future])
 
         return entries
 
-    def _download_and_parse_single(self, bucket: str, file_info: dict) -> Optional[MetadataEntry]:
+    def _download_and_parse_single(
+        self, bucket: str, file_info: S3ObjectInfo
+    ) -> Optional[MetadataEntry]:
         """Download and parse a single metadata file.
 
         Args:
             bucket: S3 bucket name
-            file_info: File information dict
+            file_info: S3 listing record
 
         Returns:
             MetadataEntry or None if error occurs
         """
-        key = file_info["Key"]
+        key = file_info.key
 
         # Download metadata
         metadata = self.s3_ops.download_metadata_content(bucket, key)
@@ -133,6 +157,33 @@ class MetadataCollector:
 
         return entry
 
+    @staticmethod
+    def _value_matches(
+        entry_value: Any, allowed_values: List[Any], allowed_set: Optional[frozenset]
+    ) -> bool:
+        """Check whether a metadata value (or any item of a list value) is allowed.
+
+        Args:
+            entry_value: Metadata value of the entry
+            allowed_values: Allowed values from the filter
+            allowed_set: Allowed values as a frozenset, or None if they are unhashable
+
+        Returns:
+            True if the value matches the filter
+        """
+        if allowed_set is not None:
+            try:
+                if isinstance(entry_value, list):
+                    return not allowed_set.isdisjoint(entry_value)
+                return entry_value in allowed_set
+            except TypeError:
+                # Unhashable values (e.g. dicts) fall back to an equality scan
+                pass
+
+        if isinstance(entry_value, list):
+            return any(v in allowed_values for v in entry_value)
+        return entry_value in allowed_values
+
     def _apply_filters(
         self, entries: List[MetadataEntry], params: CollectionParams
     ) -> List[MetadataEntry]:
@@ -148,13 +199,25 @@ class MetadataCollector:
         if not params.metadata_filters:
             return entries
 
+        # Hash sets for O(1) membership, built once rather than per entry;
+        # filters with unhashable values keep their original list
+        filter_sets = {}
+        for key, allowed_values in params.metadata_filters.items():
+            # A single value such as "Sales" is one allowed value, not an iterable of them
+            if not isinstance(allowed_values, (list, tuple, set, frozenset)):
+                allowed_values = [allowed_values]
+            try:
+                filter_sets[key] = (allowed_values, frozenset(allowed_values))
+            except TypeError:
+                filter_sets[key] = (allowed_values, None)
+
         filtered = []
 
         for entry in entries:
             # Check all filter conditions
             matches_all = True
 
-            for key, allowed_values in params.metadata_filters.items():
+            for key, (allowed_values, allowed_set) in filter_sets.items():
                 entry_value = entry.metadata.get(key)
 
                 # None values don't match
@@ -162,23 +225,18 @@ class MetadataCollector:
                     matches_all = False
                     break
 
-                # Handle list values
-                if isinstance(entry_value, list):
-                    if not any(v in allowed_values for v in entry_value):
-                        matches_all = False
-                        break
-                else:
-                    # Single value
-                    if entry_value not in allowed_values:
-                        matches_all = False
-                        break
+                if not self._value_matches(entry_value, allowed_values, allowed_set):
+                    matches_all = False
+                    break
 
             if matches_all:
                 filtered.append(entry)
 
         logger.info(
-            f"Filtered {len(entries)} entries to {len(filtered)} "
-            f"based on {len(params.metadata_filters)} filters"
+            "Filtered %d entries to %d based on %d filters",
+            len(entries),
+            len(filtered),
+            len(params.metadata_filters),
         )
 
         return filtered
@@ -1,12 +1,34 @@
 """Data models for metadata collection with fully dynamic schema support."""
 
-from collections import defaultdict
+import sys
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from ..utils.s3_operations import S3ObjectInfo
 
-@dataclass
+# Longer strings are rarely repeated categorical values, so they are not interned
+_INTERN_MAX_LENGTH = 64
+
+
+def _intern_value(value: Any) -> Any:
+    """Intern short strings, including those inside lists.
+
+    Args:
+        value: Metadata value
+
+    Returns:
+        Value with short strings replaced by their interned copy
+    """
+    if isinstance(value, str):
+        return sys.intern(value) if len(value) < _INTERN_MAX_LENGTH else value
+    if isinstance(value, list):
+        return [_intern_value(item) for item in value]
+    return value
+
+
+@dataclass(slots=True)
 class MetadataEntry:
     """Collected metadata entry with fully dynamic schema."""
 
@@ -20,12 +42,20 @@ class MetadataEntry:
     # Metadata content (completely dynamic)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # Derived from original_file_key once at construction
+    file_extension: str = field(init=False)
+
+    def __post_init__(self):
+        """Derive the lowercase file extension from the original file key."""
+        _, dot, extension = self.original_file_key.rpartition(".")
+        self.file_extension = extension.lower() if dot else ""
+
     @classmethod
     def from_s3_metadata(
         cls,
         bucket: str,
         metadata_file_key: str,
-        file_info: dict,
+        file_info: S3ObjectInfo,
         metadata_content: dict,
     ) -> "MetadataEntry":
         """Construct MetadataEntry from S3 metadata file.
@@ -33,7 +63,7 @@ class MetadataEntry:
         Args:
             bucket: S3 bucket name
             metadata_file_key: Key of the .metadata.json file
-            file_info: File information from S3 (Key, LastModified, Size)
+            file_info: S3 listing record for the metadata file
             metadata_content: Parsed metadata JSON content
 
         Returns:
@@ -45,9 +75,12 @@ class MetadataEntry:
             bucket=bucket,
             original_file_key=original_key,
             metadata_file_key=metadata_file_key,
-            last_modified=file_info["LastModified"],
-            file_size=file_info["Size"],
-            metadata=metadata_content,
+            last_modified=file_info.last_modified,
+            file_size=file_info.size,
+            # Categorical values repeat across files; share one string object each
+            metadata={
+                sys.intern(key): _intern_value(value) for key, value in metadata_content.items()
+            },
         )
 
     def get_metadata(self, key: str, default: Any = None) -> Any:
@@ -62,13 +95,6 @@ class MetadataEntry:
         """
         return self.metadata.get(key, default)
 
-    @property
-    def file_extension(self) -> str:
-        """Get file extension."""
-        if "." not in self.original_file_key:
-            return ""
-        return self.original_file_key.split(".")[-1].lower()
-
     def to_dict(self) -> dict:
         """Convert to dictionary format.
 
@@ -88,7 +114,7 @@ class MetadataEntry:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CollectionParams:
     """Parameters for metadata collection."""
 
@@ -105,7 +131,7 @@ class CollectionParams:
     parallel_downloads: int = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class CollectionResult:
     """Collection result with fully dynamic schema support."""
 
@@ -124,44 +150,7 @@ class CollectionResult:
         if not self.entries:
             return {}
 
-        schema = {}
-        total_entries = len(self.entries)
-
-        # Collect all keys
-        all_keys = set()
-        for entry in self.entries:
-            all_keys.update(entry.metadata.keys())
-
-        # Analyze each key
-        for key in all_keys:
-            values = []
-            null_count = 0
-
-            for entry in self.entries:
-                value = entry.metadata.get(key)
-                if value is None:
-                    null_count += 1
-                else:
-                    values.append(value)
-
-            if not values:
-                continue
-
-            # Determine types
-            value_types = set(type(v).__name__ for v in values)
-
-            # Check if numeric
-            is_numeric = all(isinstance(v, (int, float)) for v in values)
-
-            schema[key] = {
-                "occurrence_rate": round((len(values) / total_entries) * 100, 1),
-                "types": list(value_types),
-                "is_numeric": is_numeric,
-                "non_null_count": len(values),
-                "null_count": null_count,
-                "sample_values": list(set(str(v) for v in values[:5])),
-            }
-
+        schema, _ = self._scan()
         return schema
 
     def aggregate(self) -> Dict[str, Any]:
@@ -177,17 +166,7 @@ class CollectionResult:
                 "aggregations": {},
             }
 
-        schema = self.discover_schema()
-        aggregations = {}
-
-        # Aggregate each key
-        for key, key_info in schema.items():
-            if key_info["is_numeric"]:
-                # Numeric fields: calculate statistics
-                aggregations[key] = self._aggregate_numeric(key)
-            else:
-                # Categorical fields: count frequencies
-                aggregations[key] = self._aggregate_categorical(key)
+        schema, aggregations = self._scan()
 
         return {
             "total_collected": self.total_collected,
@@ -199,64 +178,112 @@ class CollectionResult:
             "by_file_type": self._aggregate_by_file_type(),
         }
 
-    def _aggregate_numeric(self, key: str) -> Dict[str, float]:
+    def _scan(self) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Any]]:
+        """Discover schema and aggregate every key in a single pass over entries.
+
+        Returns:
+            Tuple of (schema, aggregations) keyed by metadata key
+        """
+        total_entries = len(self.entries)
+
+        non_null_counts: Counter = Counter()
+        value_types: Dict[str, set] = defaultdict(set)
+        samples: Dict[str, List[Any]] = defaultdict(list)
+        numeric_values: Dict[str, List[Any]] = defaultdict(list)
+        # Text counts exist only for non-numeric keys; numbers seen before the first
+        # non-numeric value are counted first, so most_common ties keep encounter order
+        category_counts: Dict[str, Counter] = {}
+
+        for entry in self.entries:
+            for key, value in entry.metadata.items():
+                if value is None:
+                    continue
+
+                non_null_counts[key] += 1
+                value_types[key].add(type(value).__name__)
+
+                key_samples = samples[key]
+                if len(key_samples) < 5:
+                    key_samples.append(value)
+
+                if key in category_counts:
+                    counts = category_counts[key]
+                elif isinstance(value, (int, float)):
+                    numeric_values[key].append(value)
+                    continue
+                else:
+                    counts = category_counts[key] = Counter(map(str, numeric_values.pop(key, ())))
+
+                if isinstance(value, list):
+                    counts.update(map(str, value))
+                else:
+                    counts[str(value)] += 1
+
+        schema = {}
+        aggregations = {}
+
+        for key, non_null_count in non_null_counts.items():
+            # A key is numeric only if no non-numeric value was ever seen
+            is_numeric = key not in category_counts
+
+            schema[key] = {
+                "occurrence_rate": round((non_null_count / total_entries) * 100, 1),
+                "types": list(value_types[key]),
+                "is_numeric": is_numeric,
+                "non_null_count": non_null_count,
+                "null_count": total_entries - non_null_count,
+                "sample_values": list(set(str(v) for v in samples[key])),
+            }
+
+            if is_numeric:
+                # Numeric fields: calculate statistics
+                aggregations[key] = self._aggregate_numeric(numeric_values[key])
+            else:
+                # Categorical fields: count frequencies (numbers in mixed fields count as text)
+                aggregations[key] = self._aggregate_categorical(category_counts[key])
+
+        return schema, aggregations
+
+    @staticmethod
+    def _aggregate_numeric(values: List[Any]) -> Dict[str, float]:
         """Aggregate numeric field.
 
         Args:
-            key: Metadata key
+            values: Numeric values of the field
 
         Returns:
             Statistical values (count, min, max, avg, sum)
         """
-        values = [
-            entry.metadata.get(key)
-            for entry in self.entries
-            if entry.metadata.get(key) is not None
-            and isinstance(entry.metadata.get(key), (int, float))
-        ]
-
         if not values:
             return {"count": 0}
 
+        total = sum(values)
+
         return {
             "count": len(values),
             "min": min(values),
             "max": max(values),
-            "avg": round(sum(values) / len(values), 2),
-            "sum": sum(values),
+            "avg": round(total / len(values), 2),
+            "sum": total,
         }
 
-    def _aggregate_categorical(self, key: str) -> Dict[str, int]:
+    @staticmethod
+    def _aggregate_categorical(counts: Counter) -> Dict[str, int]:
         """Aggregate categorical field.
 
         Args:
-            key: Metadata key
+            counts: Frequency of each value of the field
 
         Returns:
             Frequency counts (top 10 + others)
         """
-        counts = defaultdict(int)
-
-        for entry in self.entries:
-            value = entry.metadata.get(key)
-            if value is not None:
-                # Handle list values
-                if isinstance(value, list):
-                    for item in value:
-                        counts[str(item)] += 1
-                else:
-                    counts[str(value)] += 1
+        # Top 10 + others (most_common(n) is a heap selection, not a full sort)
+        top_10 = dict(counts.most_common(10))
 
-        # Top 10 + others
-        sorted_counts = sorted(counts.items(), key=lambda x: x[1], reverse=True)
+        if len(counts) > 10:
+            top_10["_others"] = counts.total() - sum(top_10.values())
 
-        if len(sorted_counts) <= 10:
-            return dict(sorted_counts)
-        else:
-            top_10 = dict(sorted_counts[:10])
-            others_count = sum(count for _, count in sorted_counts[10:])
-            top_10["_others"] = others_count
-            return top_10
+        return top_10
 
     def _aggregate_by_file_type(self) -> Dict[str, int]:
         """Aggregate by file type.
@@ -264,10 +291,7 @@ class CollectionResult:
         Returns:
             Count by file extension
         """
-        counts = defaultdict(int)
-        for entry in self.entries:
-            counts[entry.file_extension] += 1
-        return dict(counts)
+        return dict(Counter(entry.file_extension for entry in self.entries))
 
     def to_json(self) -> dict:
         """Convert to JSON format.
@@ -3,6 +3,8 @@
 import json
 import logging
 import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
 from .agents.analytics_agent import MetadataAnalyticsAgent
@@ -10,7 +12,7 @@ from .collector.metadata_collector import MetadataCollector
 from .collector.models import CollectionParams
 from .utils.chart_generator import ChartGenerator
 from .utils.pdf_generator import PDFReportGenerator
-from .utils.s3_operations import upload_to_s3
+from .utils.s3_operations import upload_bytes_to_s3, upload_fileobj_to_s3
 
 # Set up logging
 logger = logging.getLogger()
@@ -23,6 +25,9 @@ pdf_generator = PDFReportGenerator()
 region = os.environ.get("AWS_REGION", "us-east-1")
 analytics_agent = MetadataAnalyticsAgent(region=region)
 
+# PDF reports are built in memory and only spill to /tmp beyond this size
+PDF_SPOOL_MAX_BYTES = 16 * 1024 * 1024
+
 
 def lambda_handler(event, context):
     """
@@ -48,7 +53,7 @@ def lambda_handler(event, context):
         end_date = datetime.now(timezone.utc)
         start_date = end_date - timedelta(days=1)
 
-        logger.info(f"Target: {bucket_name}, Period: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
+        logger.info("Target: %s, Period: %s to %s", bucket_name, start_date.date(), end_date.date())
 
         # Configure collection parameters
         params = CollectionParams(
@@ -61,14 +66,25 @@ def lambda_handler(event, context):
         # Collect metadata
         result = collector.collect(params)
 
-        logger.info(f"Collected {result.total_collected} files ({result.total_scanned} scanned) in {result.execution_time_seconds:.2f}s, {result.data_transfer_bytes / 1024 / 1024:.2f} MB")
+        logger.info(
+            "Collected %d files (%d scanned) in %.2fs, %.2f MB",
+            result.total_collected,
+            result.total_scanned,
+            result.execution_time_seconds,
+            result.data_transfer_bytes / 1024 / 1024,
+        )
 
         # Get aggregation
         aggregation = result.aggregate()
 
+        # Per-file entries are no longer needed; release them before charts, LLM and PDF
+        result.entries.clear()
+
         # Generate charts and tables deterministically
         chart_results, table_data = chart_generator.generate_charts(aggregation)
-        logger.info(f"Generated {len(chart_results)} charts, {len(table_data)} metadata detail tables")
+        logger.info(
+            "Generated %d charts, %d metadata detail tables", len(chart_results), len(table_data)
+        )
 
         # Prepare chart information for AI agent
         chart_info = [
@@ -77,48 +93,48 @@ def lambda_handler(event, context):
                 "chart_type": chart.chart_type,
                 "metadata_key": chart.metadata_key,
                 "description": chart.description,
-                "file_path": chart.file_path,
             }
             for chart in chart_results
         ]
 
-        # Perform AI analysis with pre-generated charts
-        analysis_result = analytics_agent.analyze(
-            statistics=aggregation, chart_info=chart_info
-        )
-        logger.info(f"AI analysis completed in {analysis_result['execution_time']:.2f}s")
+        report_date = end_date.strftime("%Y-%m-%d")
 
-        # Generate PDF report
-        chart_paths_for_pdf = [chart.file_path for chart in chart_results]
-        pdf_path = pdf_generator.generate_report(
-            aggregation=aggregation,
-            analysis=analysis_result,
-            start_date=start_date,
-            end_date=end_date,
-            chart_paths=chart_paths_for_pdf,
-            table_data=table_data,
-        )
+        def upload_chart(numbered_chart):
+            i, chart_result = numbered_chart
+            chart_filename = f"{i:02d}_{chart_result.metadata_key}_{chart_result.chart_type}.png"
+            chart_s3_key = f"analytics-reports/{report_date}/charts/{chart_filename}"
+            return upload_bytes_to_s3(
+                bucket_name, chart_s3_key, chart_result.image_data, "image/png"
+            )
 
-        # Upload PDF to S3
-        report_date = end_date.strftime("%Y-%m-%d")
+        # Upload charts to S3 while the AI analysis runs; neither depends on the other
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            chart_uploads = executor.map(upload_chart, enumerate(chart_results, 1))
+
+            # Perform AI analysis with pre-generated charts
+            analysis_result = analytics_agent.analyze(statistics=aggregation, chart_info=chart_info)
+            logger.info("AI analysis completed in %.2fs", analysis_result["execution_time"])
+
+            # map keeps the URLs in chart order
+            chart_urls = list(chart_uploads)
+
+        # Generate PDF report and stream it to S3
         s3_key = f"analytics-reports/{report_date}/metadata-analytics-report.pdf"
-        s3_url = upload_to_s3(bucket_name, s3_key, pdf_path)
-        logger.info(f"PDF uploaded: {s3_url}")
-
-        # Upload charts to S3
-        chart_urls = []
-        if chart_results:
-            for i, chart_result in enumerate(chart_results, 1):
-                if os.path.exists(chart_result.file_path):
-                    chart_filename = f"{i:02d}_{chart_result.metadata_key}_{chart_result.chart_type}.png"
-                    chart_s3_key = f"analytics-reports/{report_date}/charts/{chart_filename}"
-                    chart_url = upload_to_s3(bucket_name, chart_s3_key, chart_result.file_path)
-                    chart_urls.append(chart_url)
-                    os.remove(chart_result.file_path)
-
-        os.remove(pdf_path)
-        
-        logger.info(f"Charts uploaded: {len(chart_urls)} files")
+        with tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_MAX_BYTES) as pdf_file:
+            pdf_generator.generate_report(
+                pdf_file,
+                aggregation=aggregation,
+                analysis=analysis_result,
+                start_date=start_date,
+                end_date=end_date,
+                chart_images=[chart.image_data for chart in chart_results],
+                table_data=table_data,
+            )
+            pdf_file.seek(0)
+            s3_url = upload_fileobj_to_s3(bucket_name, s3_key, pdf_file, "application/pdf")
+        logger.info("PDF uploaded: %s", s3_url)
+
+        logger.info("Charts uploaded: %d files", len(chart_urls))
         logger.info("Analytics completed successfully")
 
         return {
@@ -147,7 +163,7 @@ def lambda_handler(event, context):
         }
 
     except Exception as e:
-        logger.error(f"Error in metadata analytics: {str(e)}", exc_info=True)
+        logger.error("Error in metadata analytics: %s", e, exc_info=True)
         return {
             "statusCode": 500,
             "body": json.dumps({"error": str(e), "message": "Metadata analytics failed"}),
@@ -1,5 +1,5 @@
 """Utilities module."""
 
-from .s3_operations import S3Operations
+from .s3_operations import S3ObjectInfo, S3Operations
 
-__all__ = ["S3Operations"]
+__all__ = ["S3ObjectInfo", "S3Operations"]
@@ -1,13 +1,15 @@
 """Chart generator for metadata analytics."""
 
+import heapq
+import io
 import logging
-import tempfile
 from dataclasses import dataclass
 from typing import Any, Dict, List, Tuple
 
 import matplotlib
 import matplotlib.pyplot as plt
 import seaborn as sns
+from matplotlib.figure import Figure
 
 # Use non-interactive backend for Lambda environment
 matplotlib.use("Agg")
@@ -26,7 +28,7 @@ class ChartResult:
 
     chart_type: str  # 'bar'
     title: str
-    file_path: str
+    image_data: bytes  # PNG image
     metadata_key: str  # Which metadata field this chart represents
     description: str
 
@@ -48,10 +50,29 @@ class ChartGenerator:
     MAX_LABEL_LENGTH = 80  # Average label length threshold
     MAX_CATEGORIES_FOR_CHART = 15  # Maximum categories for chart display
 
+    # PNG output: 12in-wide figures at 96 DPI stay sharp at the 6in PDF width,
+    # and fast zlib compression keeps encoding off the critical path
+    CHART_DPI = 96
+    PNG_COMPRESS_LEVEL = 1
+
     def __init__(self):
         """Initialize chart generator."""
+        # List of RGB tuples; each chart takes only as many colors as it has bars
         self.color_palette = sns.color_palette("husl", 10)
 
+        # Single figure reused for every chart; axes are cleared between renders
+        self._fig = Figure(figsize=(12, 6))
+        self._ax = self._fig.add_subplot()
+        # Fixed margins instead of a per-chart tight_layout pass; the tight bbox
+        # at save time still crops or extends the canvas to fit the labels
+        self._fig.subplots_adjust(left=0.1, right=0.95, top=0.88, bottom=0.15)
+
+        # Render once so font discovery and Agg setup happen at container init
+        self._ax.bar(["warmup"], [1])
+        self._ax.set_title("warmup", fontweight="bold")
+        self._fig.savefig(io.BytesIO(), format="png")
+        self._ax.clear()
+
     def generate_charts(
         self, aggregation: Dict[str, Any]
     ) -> Tuple[List[ChartResult], List[TableData]]:
@@ -63,35 +84,46 @@ class ChartGenerator:
         Returns:
             Tuple of (chart results, table data)
         """
-        logger.info("Starting deterministic chart and table generation...")
-        charts = []
-        tables = []
-
         # Get schema and aggregations
         schema = aggregation.get("schema", {})
         aggs = aggregation.get("aggregations", {})
         by_file_type = aggregation.get("by_file_type", {})
 
+        # Nothing collected in the period: skip rendering entirely
+        if not schema and not by_file_type:
+            logger.info("No metadata to chart")
+            return [], []
+
+        logger.info("Starting deterministic chart and table generation...")
+        charts = []
+        tables = []
+
         # 1. File type distribution (always as chart)
         if by_file_type:
             chart = self._generate_file_type_chart(by_file_type)
             if chart:
                 charts.append(chart)
 
-        # 2. Process each metadata field
-        for key, key_info in schema.items():
-            if key not in aggs:
-                continue
+        # 2. Process each categorical field that has aggregated values
+        eligible = [
+            (key, aggs[key], key_info)
+            for key, key_info in schema.items()
+            if key in aggs and not key_info.get("is_numeric", False)
+        ]
 
-            agg_data = aggs[key]
+        for key, agg_data, key_info in eligible:
+            if not agg_data:
+                continue
 
-            # Skip numeric fields
-            if key_info.get("is_numeric", False):
+            # Remove '_others' and measure labels once for both decisions below
+            chart_data = {k: v for k, v in agg_data.items() if k != "_others"}
+            if not chart_data:
                 continue
+            avg_length = sum(len(str(k)) for k in chart_data) / len(chart_data)
 
             # Decide between chart and table
-            if self._should_use_table(key, agg_data):
-                table = self._create_table_data(key, agg_data, key_info)
+            if self._should_use_table(key, chart_data, avg_length):
+                table = self._create_table_data(key, chart_data, key_info, avg_length)
                 if table:
                     tables.append(table)
             else:
@@ -99,65 +131,55 @@ class ChartGenerator:
                 if chart:
                     charts.append(chart)
 
-        logger.info(f"Generated {len(charts)} charts and {len(tables)} tables")
+        logger.info("Generated %d charts and %d tables", len(charts), len(tables))
         return charts, tables
 
-    def _should_use_table(self, key: str, data: Dict[str, int]) -> bool:
+    def _should_use_table(self, key: str, chart_data: Dict[str, int], avg_length: float) -> bool:
         """Determine if table display is more appropriate than chart.
 
         Args:
             key: Metadata key name
-            data: Dictionary of value to count
+            chart_data: Dictionary of value to count, without '_others'
+            avg_length: Average label length of chart_data keys
 
         Returns:
             True if table should be used, False for chart
         """
-        if not data:
-            return False
-
-        # Remove '_others' for analysis
-        chart_data = {k: v for k, v in data.items() if k != "_others"}
-        if not chart_data:
-            return False
-
         # Check category count
         if len(chart_data) > self.MAX_CATEGORIES_FOR_CHART:
-            logger.info(f"Using table for {key}: too many categories ({len(chart_data)})")
+            logger.info("Using table for %s: too many categories (%d)", key, len(chart_data))
             return True
 
         # Check average label length
-        avg_length = sum(len(str(k)) for k in chart_data.keys()) / len(chart_data)
         if avg_length > self.MAX_LABEL_LENGTH:
-            logger.info(f"Using table for {key}: labels too long (avg {avg_length:.1f} chars)")
+            logger.info("Using table for %s: labels too long (avg %.1f chars)", key, avg_length)
             return True
 
         return False
 
     def _create_table_data(
-        self, key: str, data: Dict[str, int], key_info: Dict[str, Any]
+        self,
+        key: str,
+        table_data: Dict[str, int],
+        key_info: Dict[str, Any],
+        avg_length: float,
     ) -> TableData:
         """Create table data for fields with long text or many categories.
 
         Args:
             key: Metadata key name
-            data: Dictionary of value to count
+            table_data: Dictionary of value to count, without '_others'
             key_info: Schema information
+            avg_length: Average label length of table_data keys
 
         Returns:
             TableData object
         """
         try:
-            # Remove '_others' if present
-            table_data = {k: v for k, v in data.items() if k != "_others"}
-
-            if not table_data:
-                return None
-
             title = key.replace("_", " ").title()
             occurrence_rate = key_info.get("occurrence_rate", 0)
 
             # Determine reason
-            avg_length = sum(len(str(k)) for k in table_data.keys()) / len(table_data)
             if avg_length > self.MAX_LABEL_LENGTH:
                 reason = f"Long text (avg {avg_length:.0f} chars)"
             elif len(table_data) > self.MAX_CATEGORIES_FOR_CHART:
@@ -173,7 +195,7 @@ class ChartGenerator:
             )
 
         except Exception as e:
-            logger.error(f"Error creating table data for {key}: {e}", exc_info=True)
+            logger.error("Error creating table data for %s: %s", key, e, exc_info=True)
             return None
 
     def _generate_file_type_chart(self, data: Dict[str, int]) -> ChartResult:
@@ -186,14 +208,18 @@ class ChartGenerator:
             ChartResult with chart information
         """
         try:
-            # Sort by count descending
-            sorted_data = sorted(data.items(), key=lambda x: x[1], reverse=True)
-            extensions = [ext or "unknown" for ext, _ in sorted_data[:10]]
-            counts = [count for _, count in sorted_data[:10]]
+            # Top 10 by count, descending
+            sorted_data = heapq.nlargest(10, data.items(), key=lambda x: x[1])
+            extensions = [ext or "unknown" for ext, _ in sorted_data]
+            counts = [count for _, count in sorted_data]
 
             # Create bar chart
-            fig, ax = plt.subplots(figsize=(12, 6))
-            bars = ax.bar(extensions, counts, color=self.color_palette)
+            fig, ax = self._fig, self._ax
+            ax.clear()
+            # clear() keeps grid settings such as alpha; restore the style's grid on both axes
+            ax.grid(alpha=plt.rcParams["grid.alpha"])
+            fig.set_size_inches(12, 6)
+            bars = ax.bar(extensions, counts, color=self.color_palette[: len(counts)])
 
             # Customize chart
             ax.set_xlabel("File Extension", fontsize=12, fontweight="bold")
@@ -202,27 +228,11 @@ class ChartGenerator:
             ax.grid(axis="y", alpha=0.3)
 
             # Add value labels on bars
-            for bar in bars:
-                height = bar.get_height()
-                ax.text(
-                    bar.get_x() + bar.get_width() / 2.0,
-                    height,
-                    f"{int(height)}",
-                    ha="center",
-                    va="bottom",
-                    fontsize=9,
-                )
-
-            plt.xticks(rotation=45, ha="right")
-            plt.tight_layout()
-
-            # Save to temporary file
-            temp_file = tempfile.NamedTemporaryFile(mode="wb", suffix=".png", delete=False)
-            file_path = temp_file.name
-            temp_file.close()
-
-            plt.savefig(file_path, dpi=150, bbox_inches="tight")
-            plt.close()
+            ax.bar_label(bars, fmt="%d", fontsize=9)
+
+            plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
+
+            image_data = self._render_png()
 
             total = sum(counts)
             description = f"Distribution of {total} files across {len(extensions)} file types"
@@ -230,13 +240,13 @@ class ChartGenerator:
             return ChartResult(
                 chart_type="bar",
                 title="File Type Distribution",
-                file_path=file_path,
+                image_data=image_data,
                 metadata_key="file_type",
                 description=description,
             )
 
         except Exception as e:
-            logger.error(f"Error generating file type chart: {e}", exc_info=True)
+            logger.error("Error generating file type chart: %s", e, exc_info=True)
             return None
 
     def _generate_bar_chart(
@@ -259,15 +269,18 @@ class ChartGenerator:
             if not chart_data:
                 return None
 
-            # Sort by count descending and limit to top 10
-            sorted_data = sorted(chart_data.items(), key=lambda x: x[1], reverse=True)
-            sorted_data = sorted_data[:10]
+            # Top 10 by count, descending
+            sorted_data = heapq.nlargest(10, chart_data.items(), key=lambda x: x[1])
             labels = [str(label) for label, _ in sorted_data]
             values = [count for _, count in sorted_data]
 
             # Create horizontal bar chart
-            fig, ax = plt.subplots(figsize=(12, max(6, len(labels) * 0.5)))
-            bars = ax.barh(labels, values, color=self.color_palette)
+            fig, ax = self._fig, self._ax
+            ax.clear()
+            # clear() keeps grid settings such as alpha; restore the style's grid on both axes
+            ax.grid(alpha=plt.rcParams["grid.alpha"])
+            fig.set_size_inches(12, max(6, len(labels) * 0.5))
+            bars = ax.barh(labels, values, color=self.color_palette[: len(values)])
 
             # Customize chart
             title = key.replace("_", " ").title()
@@ -277,26 +290,9 @@ class ChartGenerator:
             ax.grid(axis="x", alpha=0.3)
 
             # Add value labels on bars
-            for bar in bars:
-                width = bar.get_width()
-                ax.text(
-                    width,
-                    bar.get_y() + bar.get_height() / 2.0,
-                    f" {int(width)}",
-                    ha="left",
-                    va="center",
-                    fontsize=9,
-                )
-
-            plt.tight_layout()
-
-            # Save to temporary file
-            temp_file = tempfile.NamedTemporaryFile(mode="wb", suffix=".png", delete=False)
-            file_path = temp_file.name
-            temp_file.close()
-
-            plt.savefig(file_path, dpi=150, bbox_inches="tight")
-            plt.close()
+            ax.bar_label(bars, fmt="%d", padding=3, fontsize=9)
+
+            image_data = self._render_png()
 
             total = sum(values)
             occurrence_rate = key_info.get("occurrence_rate", 0)
@@ -308,11 +304,27 @@ class ChartGenerator:
             return ChartResult(
                 chart_type="bar",
                 title=f"{title} Distribution",
-                file_path=file_path,
+                image_data=image_data,
                 metadata_key=key,
                 description=description,
             )
 
         except Exception as e:
-            logger.error(f"Error generating bar chart for {key}: {e}", exc_info=True)
+            logger.error("Error generating bar chart for %s: %s", key, e, exc_info=True)
             return None
+
+    def _render_png(self) -> bytes:
+        """Render the shared figure to an in-memory PNG.
+
+        Returns:
+            PNG image bytes
+        """
+        buffer = io.BytesIO()
+        self._fig.savefig(
+            buffer,
+            format="png",
+            dpi=self.CHART_DPI,
+            bbox_inches="tight",
+            pil_kwargs={"compress_level": self.PNG_COMPRESS_LEVEL},
+        )
+        return buffer.getvalue()
@@ -1,10 +1,11 @@
 """PDF report generator."""
 
+import io
 import logging
-import os
-import tempfile
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from html import escape
+from operator import itemgetter
+from typing import Any, BinaryIO, Dict, List, Optional
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
@@ -61,40 +62,45 @@ class PDFReportGenerator:
             )
         )
 
+        # Metadata entry style with smaller font
+        self.styles.add(
+            ParagraphStyle(
+                name="MetadataEntry",
+                parent=self.styles["BodyText"],
+                fontSize=9,
+                textColor=colors.HexColor("#333333"),
+                spaceAfter=8,
+                leftIndent=20,
+                leading=11,
+            )
+        )
+
     def generate_report(
         self,
+        output: BinaryIO,
         aggregation: Dict[str, Any],
         analysis: Dict[str, Any],
         start_date: datetime,
         end_date: datetime,
-        chart_paths: Optional[list] = None,
+        chart_images: Optional[List[bytes]] = None,
         table_data: Optional[list] = None,
-    ) -> str:
+    ) -> None:
         """Generate PDF report from analysis result.
 
         Args:
+            output: Writable binary file object the PDF is written to
             aggregation: Aggregated statistics from metadata collection
             analysis: Analysis result from AI agent
             start_date: Start date of analysis period
             end_date: End date of analysis period
-            chart_paths: List of chart file paths to embed in PDF
+            chart_images: List of chart PNG images to embed in PDF
             table_data: List of TableData objects for detailed metadata display
-
-        Returns:
-            Path to the generated PDF file
         """
         logger.info("Generating PDF report...")
 
-        # Create temporary file for PDF
-        temp_file = tempfile.NamedTemporaryFile(
-            mode="wb", suffix=".pdf", delete=False
-        )
-        pdf_path = temp_file.name
-        temp_file.close()
-
         # Create PDF document
         doc = SimpleDocTemplate(
-            pdf_path,
+            output,
             pagesize=letter,
             rightMargin=inch,
             leftMargin=inch,
@@ -162,7 +168,7 @@ class PDFReportGenerator:
         story.append(Spacer(1, 0.3 * inch))
 
         # Charts section with embedded images
-        if chart_paths:
+        if chart_images:
             story.append(PageBreak())
             story.append(
                 Paragraph(
@@ -173,26 +179,30 @@ class PDFReportGenerator:
             story.append(Spacer(1, 0.2 * inch))
 
             # Embed each chart image
-            for i, chart_path in enumerate(chart_paths, 1):
-                if os.path.exists(chart_path):
-                    try:
-                        # Add chart image
-                        img = Image(chart_path, width=6 * inch, height=3.6 * inch)
-                        story.append(img)
-                        story.append(Spacer(1, 0.3 * inch))
-
-                        # Add page break after every 2 charts for better layout
-                        if i % 2 == 0 and i < len(chart_paths):
-                            story.append(PageBreak())
-                    except Exception as e:
-                        logger.warning(f"Failed to embed chart {chart_path}: {e}")
-                        # Add placeholder text if image fails
-                        error_para = Paragraph(
-                            f"<i>Chart {i}: Image embedding failed</i>",
-                            self.styles["CustomBody"],
-                        )
-                        story.append(error_para)
-                        story.append(Spacer(1, 0.2 * inch))
+            for i, image_data in enumerate(chart_images, 1):
+                try:
+                    # Add chart image, scaled into the box without distorting its aspect ratio
+                    img = Image(
+                        io.BytesIO(image_data),
+                        width=6 * inch,
+                        height=3.6 * inch,
+                        kind="proportional",
+                    )
+                    story.append(img)
+                    story.append(Spacer(1, 0.3 * inch))
+
+                    # Add page break after every 2 charts for better layout
+                    if i % 2 == 0 and i < len(chart_images):
+                        story.append(PageBreak())
+                except Exception as e:
+                    logger.warning("Failed to embed chart %d: %s", i, e)
+                    # Add placeholder text if image fails
+                    error_para = Paragraph(
+                        f"<i>Chart {i}: Image embedding failed</i>",
+                        self.styles["CustomBody"],
+                    )
+                    story.append(error_para)
+                    story.append(Spacer(1, 0.2 * inch))
 
         # Detailed metadata text section
         if table_data:
@@ -226,8 +236,7 @@ class PDFReportGenerator:
         # Build PDF
         doc.build(story)
 
-        logger.info(f"PDF report generated: {pdf_path}")
-        return pdf_path
+        logger.info("PDF report generated")
 
     def _create_statistics_table(self, aggregation: Dict[str, Any]) -> Table:
         """Create statistics summary table.
@@ -247,10 +256,12 @@ class PDFReportGenerator:
         if by_file_type:
             data.append(["", ""])  # Empty row
             data.append(["File Types", "Count"])
-            for ext, count in sorted(by_file_type.items(), key=lambda x: x[1], reverse=True):
+            for ext, count in sorted(by_file_type.items(), key=itemgetter(1), reverse=True):
                 data.append([ext or "unknown", str(count)])
 
-        table = Table(data, colWidths=[3 * inch, 2 * inch])
+        # Fixed row heights (taller header) skip ReportLab's per-cell height calculation
+        row_heights = [0.375 * inch] + [0.25 * inch] * (len(data) - 1)
+        table = Table(data, colWidths=[3 * inch, 2 * inch], rowHeights=row_heights)
         table.setStyle(
             TableStyle(
                 [
@@ -284,30 +295,19 @@ class PDFReportGenerator:
             table_info: TableData object with field information
         """
         # Sort by count descending
-        sorted_data = sorted(
-            table_info.data.items(), key=lambda x: x[1], reverse=True
-        )
+        sorted_data = sorted(table_info.data.items(), key=itemgetter(1), reverse=True)
 
         # Calculate total for percentages
         total = sum(table_info.data.values())
 
-        # Add custom style for metadata entries with smaller font
-        entry_style = ParagraphStyle(
-            name="MetadataEntry",
-            parent=self.styles["BodyText"],
-            fontSize=9,
-            textColor=colors.HexColor("#333333"),
-            spaceAfter=8,
-            leftIndent=20,
-            leading=11,
-        )
+        entry_style = self.styles["MetadataEntry"]
 
         # Display all entries (no limit)
         for i, (value, count) in enumerate(sorted_data, 1):
             percentage = (count / total) * 100
 
             # Format the value - escape special characters for ReportLab
-            value_str = str(value).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            value_str = escape(str(value), quote=False)
 
             # Create entry text
             entry_text = (
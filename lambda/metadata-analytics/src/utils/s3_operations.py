@@ -3,13 +3,54 @@
 import json
 import logging
 from datetime import datetime
-from typing import Iterator, Optional
+from typing import BinaryIO, Iterator, NamedTuple, Optional
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 logger = logging.getLogger(__name__)
 
+# Connection pool sized for parallel metadata downloads (botocore defaults to 10)
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+# Multipart settings for report uploads; parts are sent in parallel above the threshold
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=8,
+)
+
+_s3_client = None
+
+
+class S3ObjectInfo(NamedTuple):
+    """Listing record for a single S3 object."""
+
+    key: str
+    last_modified: datetime
+    size: int
+
+
+def get_s3_client():
+    """Get the shared S3 client, creating it on first use.
+
+    A single client is reused across uploads, downloads and warm Lambda
+    invocations so service model loading and TLS setup are paid once.
+
+    Returns:
+        boto3 S3 client
+    """
+    global _s3_client
+    if _s3_client is None:
+        _s3_client = boto3.client("s3", config=S3_CLIENT_CONFIG)
+    return _s3_client
+
 
 def upload_to_s3(bucket: str, key: str, file_path: str) -> str:
     """Upload a file to S3.
@@ -25,20 +66,90 @@ def upload_to_s3(bucket: str, key: str, file_path: str) -> str:
     Raises:
         ClientError: If upload fails
     """
-    s3_client = boto3.client("s3")
+    s3_client = get_s3_client()
 
     try:
-        logger.info(f"Uploading {file_path} to s3://{bucket}/{key}")
+        logger.info("Uploading %s to s3://%s/%s", file_path, bucket, key)
         s3_client.upload_file(file_path, bucket, key)
         s3_url = f"s3://{bucket}/{key}"
-        logger.info(f"Successfully uploaded to {s3_url}")
+        logger.info("Successfully uploaded to %s", s3_url)
         return s3_url
 
     except ClientError as e:
-        logger.error(f"Failed to upload {file_path} to s3://{bucket}/{key}: {e}")
+        logger.error("Failed to upload %s to s3://%s/%s: %s", file_path, bucket, key, e)
         raise
     except Exception as e:
-        logger.error(f"Unexpected error uploading {file_path}: {e}")
+        logger.error("Unexpected error uploading %s: %s", file_path, e)
+        raise
+
+
+def upload_bytes_to_s3(bucket: str, key: str, data: bytes, content_type: str) -> str:
+    """Upload in-memory content to S3.
+
+    Args:
+        bucket: S3 bucket name
+        key: S3 object key (path in bucket)
+        data: Content to upload
+        content_type: MIME type of the content
+
+    Returns:
+        S3 URL of the uploaded object (s3://bucket/key format)
+
+    Raises:
+        ClientError: If upload fails
+    """
+    s3_client = get_s3_client()
+
+    try:
+        logger.info("Uploading %d bytes to s3://%s/%s", len(data), bucket, key)
+        s3_client.put_object(Bucket=bucket, Key=key, Body=data, ContentType=content_type)
+        s3_url = f"s3://{bucket}/{key}"
+        logger.info("Successfully uploaded to %s", s3_url)
+        return s3_url
+
+    except ClientError as e:
+        logger.error("Failed to upload to s3://%s/%s: %s", bucket, key, e)
+        raise
+    except Exception as e:
+        logger.error("Unexpected error uploading to s3://%s/%s: %s", bucket, key, e)
+        raise
+
+
+def upload_fileobj_to_s3(bucket: str, key: str, fileobj: BinaryIO, content_type: str) -> str:
+    """Upload a readable binary file object to S3.
+
+    Args:
+        bucket: S3 bucket name
+        key: S3 object key (path in bucket)
+        fileobj: File object positioned at the start of the content
+        content_type: MIME type of the content
+
+    Returns:
+        S3 URL of the uploaded object (s3://bucket/key format)
+
+    Raises:
+        ClientError: If upload fails
+    """
+    s3_client = get_s3_client()
+
+    try:
+        logger.info("Uploading to s3://%s/%s", bucket, key)
+        s3_client.upload_fileobj(
+            fileobj,
+            bucket,
+            key,
+            ExtraArgs={"ContentType": content_type},
+            Config=S3_TRANSFER_CONFIG,
+        )
+        s3_url = f"s3://{bucket}/{key}"
+        logger.info("Successfully uploaded to %s", s3_url)
+        return s3_url
+
+    except ClientError as e:
+        logger.error("Failed to upload to s3://%s/%s: %s", bucket, key, e)
+        raise
+    except Exception as e:
+        logger.error("Unexpected error uploading to s3://%s/%s: %s", bucket, key, e)
         raise
 
 
@@ -51,7 +162,7 @@ class S3Operations:
         Args:
             s3_client: boto3 S3 client (injectable for testing)
         """
-        self.s3_client = s3_client or boto3.client("s3")
+        self.s3_client = s3_client or get_s3_client()
 
     def list_metadata_files(
         self,
@@ -59,21 +170,26 @@ class S3Operations:
         prefix: Optional[str] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-    ) -> Iterator[dict]:
+        suffix: str = ".metadata.json",
+    ) -> Iterator[S3ObjectInfo]:
         """List .metadata.json files from S3 with pagination support.
 
+        Keys are streamed page by page, so callers never hold more than one
+        list page in memory and buckets larger than 1000 objects are not truncated.
+
         Args:
             bucket: S3 bucket name
             prefix: S3 prefix to filter files
             start_date: Filter files modified after this date
             end_date: Filter files modified before this date
+            suffix: Only yield keys ending with this suffix
 
         Yields:
-            File information dict (Key, LastModified, Size)
+            S3ObjectInfo for each matching file
         """
         paginator = self.s3_client.get_paginator("list_objects_v2")
 
-        page_config = {"Bucket": bucket}
+        page_config = {"Bucket": bucket, "PaginationConfig": {"PageSize": 1000}}
 
         if prefix:
             page_config["Prefix"] = prefix
@@ -86,8 +202,8 @@ class S3Operations:
                 for obj in page["Contents"]:
                     key = obj["Key"]
 
-                    # Only .metadata.json files
-                    if not key.endswith(".metadata.json"):
+                    # Only metadata files (skip raw documents before any further work)
+                    if not key.endswith(suffix):
                         continue
 
                     last_modified = obj["LastModified"]
@@ -98,10 +214,10 @@ class S3Operations:
                     if end_date and last_modified > end_date:
                         continue
 
-                    yield {"Key": key, "LastModified": last_modified, "Size": obj["Size"]}
+                    yield S3ObjectInfo(key, last_modified, obj["Size"])
 
         except ClientError as e:
-            logger.error(f"Failed to list objects from s3://{bucket}/{prefix or ''}: {e}")
+            logger.error("Failed to list objects from s3://%s/%s: %s", bucket, prefix or "", e)
             raise
 
     def download_metadata_content(self, bucket: str, key: str) -> Optional[dict]:
@@ -116,17 +232,17 @@ class S3Operations:
         """
         try:
             response = self.s3_client.get_object(Bucket=bucket, Key=key)
-            content = response["Body"].read().decode("utf-8")
 
-            metadata = json.loads(content)
+            # json.loads accepts UTF-8 bytes directly; skip the intermediate str copy
+            metadata = json.loads(response["Body"].read())
             return metadata
 
         except ClientError as e:
-            logger.error(f"Failed to download s3://{bucket}/{key}: {e}")
+            logger.error("Failed to download s3://%s/%s: %s", bucket, key, e)
             return None
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON s3://{bucket}/{key}: {e}")
+            logger.error("Failed to parse JSON s3://%s/%s: %s", bucket, key, e)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error downloading s3://{bucket}/{key}: {e}")
+            logger.error("Unexpected error downloading s3://%s/%s: %s", bucket, key, e)
             return None
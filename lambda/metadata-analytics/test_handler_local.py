@@ -19,8 +19,9 @@ import json
 import logging
 import os
 import sys
+from contextlib import ExitStack
 from datetime import datetime
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 # Configure logging
 logging.basicConfig(
@@ -40,16 +41,14 @@ DRY_RUN = os.environ.get("DRY_RUN", "false").lower() == "true"
 
 if DRY_RUN:
     logger.warning("🔴 DRY RUN MODE: S3 uploads will be skipped")
-    # Mock S3 upload function
-    import src.utils.s3_operations as s3_ops
 
-    def mock_upload(bucket, key, filepath):
-        logger.info(f"[DRY RUN] Would upload {filepath} to s3://{bucket}/{key}")
-        return f"s3://{bucket}/{key}"
+from src.handler import lambda_handler
 
-    s3_ops.upload_to_s3 = mock_upload
 
-from src.handler import lambda_handler
+def mock_upload(bucket, key, data, content_type):
+    """Mock S3 upload used in dry run mode."""
+    logger.info("[DRY RUN] Would upload %s to s3://%s/%s", content_type, bucket, key)
+    return f"s3://{bucket}/{key}"
 
 
 def create_mock_context():
@@ -112,7 +111,12 @@ def main():
 
     # Execute handler
     try:
-        response = lambda_handler(event, context)
+        with ExitStack() as stack:
+            if DRY_RUN:
+                # Patch the names bound in the handler module, not the s3_operations originals
+                for name in ("upload_bytes_to_s3", "upload_fileobj_to_s3"):
+                    stack.enter_context(patch(f"src.handler.{name}", side_effect=mock_upload))
+            response = lambda_handler(event, context)
 
         print_header("EXECUTION RESULT")
 
@@ -0,0 +1,94 @@
+"""Tests for metadata analytics agent."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.agents.analytics_agent import AnalysisOutput, DetailedStatistics, MetadataAnalyticsAgent
+
+
+class TestMetadataAnalyticsAgent:
+    """Test cases for MetadataAnalyticsAgent."""
+
+    @pytest.fixture
+    def mock_agent(self):
+        """Patch the Strands Agent with a mock instance."""
+        with patch("src.agents.analytics_agent.Agent") as agent_class:
+            yield agent_class.return_value
+
+    @pytest.fixture
+    def statistics(self):
+        """Create minimal aggregation statistics."""
+        return {
+            "total_collected": 10,
+            "aggregations": {"department": {"Sales": 7, "Engineering": 3}},
+            "by_file_type": {"pdf": 10},
+        }
+
+    @pytest.fixture
+    def chart_info(self):
+        """Create chart information for one chart."""
+        return [
+            {
+                "title": "File Type Distribution",
+                "chart_type": "bar",
+                "metadata_key": "file_type",
+                "description": "Distribution of 10 files",
+            }
+        ]
+
+    def test_analyze_maps_structured_output(self, mock_agent, statistics, chart_info):
+        """Test that the structured output model is mapped to the result dict."""
+        mock_agent.return_value.structured_output = AnalysisOutput(
+            executive_summary="Sales dominates.",
+            key_findings=["Sales has 70% of files"],
+            detailed_statistics=DetailedStatistics(
+                summary="10 files analyzed",
+                notable_patterns=["All files are PDFs"],
+                recommendations=["Add more departments"],
+            ),
+        )
+
+        result = MetadataAnalyticsAgent().analyze(statistics=statistics, chart_info=chart_info)
+
+        assert mock_agent.call_args.kwargs["structured_output_model"] is AnalysisOutput
+        assert result["executive_summary"] == "Sales dominates."
+        assert result["key_findings"] == ["Sales has 70% of files"]
+        assert result["detailed_statistics"] == {
+            "summary": "10 files analyzed",
+            "notable_patterns": ["All files are PDFs"],
+            "recommendations": ["Add more departments"],
+        }
+        assert result["charts"] == ["File Type Distribution"]
+        assert result["execution_time"] >= 0
+        assert "raw_response" not in result
+
+    def test_analyze_falls_back_when_agent_fails(self, mock_agent, statistics, chart_info):
+        """Test that an agent error returns the fallback analysis."""
+        mock_agent.side_effect = RuntimeError("model unavailable")
+
+        result = MetadataAnalyticsAgent().analyze(statistics=statistics, chart_info=chart_info)
+
+        assert result["raw_response"] == "Fallback analysis (agent execution failed)"
+        assert "Top department: Sales with 7 files" in result["key_findings"]
+        assert result["charts"] == ["File Type Distribution"]
+
+    def test_analyze_sends_only_current_prompt(self, mock_agent, statistics, chart_info):
+        """Test that a repeated analysis does not resend earlier conversation turns."""
+        sent_messages = []
+
+        def call_agent(prompt, **kwargs):
+            mock_agent.messages.append({"role": "user", "content": [{"text": prompt}]})
+            sent_messages.append(list(mock_agent.messages))
+            mock_agent.messages.append({"role": "assistant", "content": []})
+            raise RuntimeError("no structured output")
+
+        mock_agent.messages = []
+        mock_agent.side_effect = call_agent
+        agent = MetadataAnalyticsAgent()
+
+        agent.analyze(statistics=statistics, chart_info=chart_info)
+        agent.analyze(statistics=statistics, chart_info=chart_info)
+
+        assert [len(messages) for messages in sent_messages] == [1, 1]
+        assert sent_messages[1][0]["role"] == "user"
@@ -1,7 +1,6 @@
 """Tests for chart generator."""
 
 import os
-from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -11,12 +10,12 @@ from src.utils.chart_generator import ChartGenerator, ChartResult, TableData
 class TestChartGenerator:
     """Test chart generator functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def chart_generator(self):
-        """Create chart generator instance."""
+        """Create chart generator instance shared by the module's tests."""
         return ChartGenerator()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_aggregation(self):
         """Create sample aggregation data."""
         return {
@@ -71,54 +70,49 @@ class TestChartGenerator:
 
     def test_generate_charts_returns_tuple(self, chart_generator, sample_aggregation):
         """Test that generate_charts returns tuple of charts and tables."""
-        with patch("matplotlib.pyplot.savefig"), patch("matplotlib.pyplot.close"):
-            charts, tables = chart_generator.generate_charts(sample_aggregation)
-            assert isinstance(charts, list)
-            assert isinstance(tables, list)
-            assert len(charts) > 0 or len(tables) > 0
+        charts, tables = chart_generator.generate_charts(sample_aggregation)
+        assert isinstance(charts, list)
+        assert isinstance(tables, list)
+        assert len(charts) > 0 or len(tables) > 0
 
     def test_generate_file_type_chart(self, chart_generator, sample_aggregation):
         """Test file type chart generation."""
-        with patch("matplotlib.pyplot.savefig"), patch("matplotlib.pyplot.close"):
-            charts, tables = chart_generator.generate_charts(sample_aggregation)
-            file_type_charts = [c for c in charts if c.metadata_key == "file_type"]
-            assert len(file_type_charts) == 1
-            chart = file_type_charts[0]
-            assert chart.chart_type == "bar"
-            assert chart.title == "File Type Distribution"
+        charts, tables = chart_generator.generate_charts(sample_aggregation)
+        file_type_charts = [c for c in charts if c.metadata_key == "file_type"]
+        assert len(file_type_charts) == 1
+        chart = file_type_charts[0]
+        assert chart.chart_type == "bar"
+        assert chart.title == "File Type Distribution"
 
     def test_generate_categorical_charts(self, chart_generator, sample_aggregation):
         """Test categorical field chart generation."""
-        with patch("matplotlib.pyplot.savefig"), patch("matplotlib.pyplot.close"):
-            charts, tables = chart_generator.generate_charts(sample_aggregation)
+        charts, tables = chart_generator.generate_charts(sample_aggregation)
 
-            # Should have charts or tables for categorical fields
-            all_keys = [c.metadata_key for c in charts] + [t.metadata_key for t in tables]
-            assert "department" in all_keys
-            assert "document_type" in all_keys
+        # Should have charts or tables for categorical fields
+        all_keys = [c.metadata_key for c in charts] + [t.metadata_key for t in tables]
+        assert "department" in all_keys
+        assert "document_type" in all_keys
 
     def test_chart_result_has_required_fields(self, chart_generator, sample_aggregation):
         """Test that ChartResult has all required fields."""
-        with patch("matplotlib.pyplot.savefig"), patch("matplotlib.pyplot.close"):
-            charts, tables = chart_generator.generate_charts(sample_aggregation)
-            for chart in charts:
-                assert hasattr(chart, "chart_type")
-                assert hasattr(chart, "title")
-                assert hasattr(chart, "file_path")
-                assert hasattr(chart, "metadata_key")
-                assert hasattr(chart, "description")
-                assert chart.chart_type == "bar"
+        charts, tables = chart_generator.generate_charts(sample_aggregation)
+        for chart in charts:
+            assert hasattr(chart, "chart_type")
+            assert hasattr(chart, "title")
+            assert hasattr(chart, "image_data")
+            assert hasattr(chart, "metadata_key")
+            assert hasattr(chart, "description")
+            assert chart.chart_type == "bar"
 
     def test_table_data_has_required_fields(self, chart_generator, sample_aggregation):
         """Test that TableData has all required fields."""
-        with patch("matplotlib.pyplot.savefig"), patch("matplotlib.pyplot.close"):
-            charts, tables = chart_generator.generate_charts(sample_aggregation)
-            for table in tables:
-                assert hasattr(table, "metadata_key")
-                assert hasattr(table, "title")
-                assert hasattr(table, "data")
-                assert hasattr(table, "reason")
-                assert isinstance(table.data, dict)
+        charts, tables = chart_generator.generate_charts(sample_aggregation)
+        for table in tables:
+            assert hasattr(table, "metadata_key")
+            assert hasattr(table, "title")
+            assert hasattr(table, "data")
+            assert hasattr(table, "reason")
+            assert isinstance(table.data, dict)
 
     def test_handle_empty_aggregation(self, chart_generator):
         """Test handling of empty aggregation data."""
@@ -155,12 +149,11 @@ class TestChartGenerator:
             "by_file_type": {},
         }
 
-        with patch("matplotlib.pyplot.savefig"), patch("matplotlib.pyplot.close"):
-            charts, tables = chart_generator.generate_charts(long_text_data)
-            # Long text should create table
-            long_field_tables = [t for t in tables if t.metadata_key == "long_field"]
-            assert len(long_field_tables) == 1
-            assert "Long text" in long_field_tables[0].reason
+        charts, tables = chart_generator.generate_charts(long_text_data)
+        # Long text should create table
+        long_field_tables = [t for t in tables if t.metadata_key == "long_field"]
+        assert len(long_field_tables) == 1
+        assert "Long text" in long_field_tables[0].reason
 
     def test_many_categories_creates_table(self, chart_generator):
         """Test that fields with many categories create tables."""
@@ -181,33 +174,44 @@ class TestChartGenerator:
             "by_file_type": {},
         }
 
-        with patch("matplotlib.pyplot.savefig"), patch("matplotlib.pyplot.close"):
-            charts, tables = chart_generator.generate_charts(many_categories)
-            # Many categories should create table
-            many_cat_tables = [t for t in tables if t.metadata_key == "many_cats"]
-            assert len(many_cat_tables) == 1
-            assert "Many categories" in many_cat_tables[0].reason
+        charts, tables = chart_generator.generate_charts(many_categories)
+        # Many categories should create table
+        many_cat_tables = [t for t in tables if t.metadata_key == "many_cats"]
+        assert len(many_cat_tables) == 1
+        assert "Many categories" in many_cat_tables[0].reason
 
     def test_numeric_fields_skipped(self, chart_generator, sample_aggregation):
         """Test that numeric fields are skipped (no raw data for histogram)."""
-        with patch("matplotlib.pyplot.savefig"), patch("matplotlib.pyplot.close"):
-            charts, tables = chart_generator.generate_charts(sample_aggregation)
-            # Numeric fields should be skipped entirely
-            all_keys = [c.metadata_key for c in charts] + [t.metadata_key for t in tables]
-            assert "page_count" not in all_keys
-
-    def test_chart_file_paths_are_temporary(self, chart_generator, sample_aggregation):
-        """Test that generated charts use temporary file paths."""
-        with patch("matplotlib.pyplot.savefig") as mock_savefig, patch(
-            "matplotlib.pyplot.close"
-        ):
-            charts, tables = chart_generator.generate_charts(sample_aggregation)
-            for chart in charts:
-                assert chart.file_path.endswith(".png")
-                # Should be in temp directory
-                assert "tmp" in chart.file_path.lower() or chart.file_path.startswith(
-                    "/var/folders"
-                )
+        charts, tables = chart_generator.generate_charts(sample_aggregation)
+        # Numeric fields should be skipped entirely
+        all_keys = [c.metadata_key for c in charts] + [t.metadata_key for t in tables]
+        assert "page_count" not in all_keys
+
+    def test_charts_are_rendered_in_memory(self, chart_generator, sample_aggregation):
+        """Test that generated charts are returned as PNG bytes."""
+        charts, tables = chart_generator.generate_charts(sample_aggregation)
+        assert len(charts) > 0
+        for chart in charts:
+            assert isinstance(chart.image_data, bytes)
+            assert chart.image_data.startswith(b"\x89PNG")
+
+    def test_chart_bytes_do_not_depend_on_render_order(self, sample_aggregation):
+        """Test that a chart renders identically first or after another chart."""
+        department = sample_aggregation["aggregations"]["department"]
+        key_info = sample_aggregation["schema"]["department"]
+        by_file_type = sample_aggregation["by_file_type"]
+
+        first = ChartGenerator()._generate_bar_chart("department", department, key_info)
+        generator = ChartGenerator()
+        generator._generate_file_type_chart(by_file_type)
+        after_file_type = generator._generate_bar_chart("department", department, key_info)
+        assert after_file_type.image_data == first.image_data
+
+        first = ChartGenerator()._generate_file_type_chart(by_file_type)
+        generator = ChartGenerator()
+        generator._generate_bar_chart("department", department, key_info)
+        after_bar = generator._generate_file_type_chart(by_file_type)
+        assert after_bar.image_data == first.image_data
 
     def test_error_handling_in_chart_generation(self, chart_generator):
         """Test error handling when chart generation fails."""
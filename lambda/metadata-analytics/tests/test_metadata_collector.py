@@ -8,16 +8,16 @@ from unittest.mock import Mock
 import pytest
 
 from src.collector.metadata_collector import MetadataCollector
-from src.collector.models import CollectionParams, MetadataEntry
-from src.utils.s3_operations import S3Operations
+from src.collector.models import CollectionParams, CollectionResult, MetadataEntry
+from src.utils.s3_operations import S3ObjectInfo, S3Operations
 
 
 class TestMetadataCollector:
     """Test cases for MetadataCollector."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_metadata(self):
-        """Load sample metadata fixture."""
+        """Load sample metadata fixture once for the module."""
         fixture_path = Path(__file__).parent / "fixtures" / "sample_metadata.json"
         with open(fixture_path, "r") as f:
             return json.load(f)
@@ -31,16 +31,10 @@ class TestMetadataCollector:
         now = datetime.now(timezone.utc)
         mock_s3.list_metadata_files.return_value = iter(
             [
-                {
-                    "Key": "reports/sales-report.pdf.metadata.json",
-                    "LastModified": now,
-                    "Size": 1024,
-                },
-                {
-                    "Key": "reports/engineering-doc.md.metadata.json",
-                    "LastModified": now - timedelta(hours=1),
-                    "Size": 512,
-                },
+                S3ObjectInfo("reports/sales-report.pdf.metadata.json", now, 1024),
+                S3ObjectInfo(
+                    "reports/engineering-doc.md.metadata.json", now - timedelta(hours=1), 512
+                ),
             ]
         )
 
@@ -49,67 +43,143 @@ class TestMetadataCollector:
 
         return mock_s3
 
-    def test_collect_basic(self, mock_s3_operations):
-        """Test basic metadata collection."""
-        collector = MetadataCollector(s3_operations=mock_s3_operations)
+    @pytest.fixture(scope="module")
+    def base_params_kwargs(self):
+        """Common CollectionParams arguments covering the last day."""
+        now = datetime.now(timezone.utc)
+        return {
+            "bucket_name": "test-bucket",
+            "start_date": now - timedelta(days=1),
+            "end_date": now,
+        }
 
-        params = CollectionParams(
-            bucket_name="test-bucket",
-            start_date=datetime.now(timezone.utc) - timedelta(days=1),
-            end_date=datetime.now(timezone.utc),
-        )
+    @pytest.mark.parametrize(
+        "overrides, expected_collected",
+        [
+            ({}, 2),
+            # Both files match the filter
+            ({"metadata_filters": {"department": ["Sales"], "document_type": ["report"]}}, 2),
+            ({"max_results": 1}, 1),
+        ],
+        ids=["basic", "filters", "max_results"],
+    )
+    def test_collect(self, mock_s3_operations, base_params_kwargs, overrides, expected_collected):
+        """Test metadata collection with optional filters and limits."""
+        collector = MetadataCollector(s3_operations=mock_s3_operations)
+        params = CollectionParams(**base_params_kwargs, **overrides)
 
         result = collector.collect(params)
 
         assert result.total_scanned == 2
-        assert result.total_collected == 2
-        assert len(result.entries) == 2
+        assert result.total_collected == expected_collected
+        assert len(result.entries) == expected_collected
         assert result.execution_time_seconds > 0
+        for entry in result.entries:
+            for key, allowed in overrides.get("metadata_filters", {}).items():
+                assert entry.metadata.get(key) in allowed
 
-    def test_collect_with_filters(self, mock_s3_operations):
-        """Test collection with metadata filters."""
+    def test_collect_more_files_than_download_window(self, mock_s3_operations):
+        """Test that files beyond the in-flight window are all downloaded."""
+        now = datetime.now(timezone.utc)
+        mock_s3_operations.list_metadata_files.return_value = iter(
+            S3ObjectInfo(f"docs/file{i}.pdf.metadata.json", now, 10) for i in range(25)
+        )
         collector = MetadataCollector(s3_operations=mock_s3_operations)
 
         params = CollectionParams(
             bucket_name="test-bucket",
-            start_date=datetime.now(timezone.utc) - timedelta(days=1),
-            end_date=datetime.now(timezone.utc),
-            metadata_filters={"department": ["Sales"], "document_type": ["report"]},
+            start_date=now - timedelta(days=1),
+            end_date=now,
+            parallel_downloads=2,
+            max_results=20,
         )
 
         result = collector.collect(params)
 
-        assert result.total_collected == 2  # Both match the filter
-        for entry in result.entries:
-            assert entry.metadata.get("department") == "Sales"
-            assert entry.metadata.get("document_type") == "report"
-
-    def test_collect_with_max_results(self, mock_s3_operations):
-        """Test collection with max_results limit."""
+        assert result.total_scanned == 25
+        assert result.total_collected == 20
+        assert mock_s3_operations.download_metadata_content.call_count == 20
+
+    def test_collect_skips_failed_downloads(
+        self, mock_s3_operations, sample_metadata, base_params_kwargs
+    ):
+        """Test that a failing file is skipped without aborting collection."""
+        mock_s3_operations.download_metadata_content.side_effect = [
+            RuntimeError("boom"),
+            sample_metadata,
+        ]
         collector = MetadataCollector(s3_operations=mock_s3_operations)
 
-        params = CollectionParams(
-            bucket_name="test-bucket",
-            start_date=datetime.now(timezone.utc) - timedelta(days=1),
-            end_date=datetime.now(timezone.utc),
-            max_results=1,
-        )
+        params = CollectionParams(**base_params_kwargs, parallel_downloads=1)
 
         result = collector.collect(params)
 
         assert result.total_scanned == 2
         assert result.total_collected == 1
-        assert len(result.entries) == 1
 
-    def test_aggregation(self, mock_s3_operations, sample_metadata):
+    def test_apply_filters_with_dict_values(self, mock_s3_operations, base_params_kwargs):
+        """Test that dict-valued metadata and filters are matched by equality."""
+        now = datetime.now(timezone.utc)
+        metadata_list = [
+            {"owner": {"name": "Alice"}, "tags": [{"k": 1}, "x"], "department": "Sales"},
+            {"owner": {"name": "Bob"}, "tags": [{"k": 2}], "department": {"id": 7}},
+        ]
+        entries = [
+            MetadataEntry(
+                bucket="test-bucket",
+                original_file_key=f"docs/file{i}.pdf",
+                metadata_file_key=f"docs/file{i}.pdf.metadata.json",
+                last_modified=now,
+                file_size=10,
+                metadata=metadata,
+            )
+            for i, metadata in enumerate(metadata_list)
+        ]
+        collector = MetadataCollector(s3_operations=mock_s3_operations)
+
+        def apply(metadata_filters):
+            params = CollectionParams(**base_params_kwargs, metadata_filters=metadata_filters)
+            return [
+                entry.metadata["owner"]["name"]
+                for entry in collector._apply_filters(entries, params)
+            ]
+
+        assert apply({"department": ["Sales"]}) == ["Alice"]
+        assert apply({"tags": ["x"]}) == ["Alice"]
+        assert apply({"tags": [{"k": 2}]}) == ["Bob"]
+        assert apply({"owner": [{"name": "Bob"}], "department": [{"id": 7}]}) == ["Bob"]
+
+    def test_apply_filters_with_single_value(self, mock_s3_operations, base_params_kwargs):
+        """Test that a filter given as a single value matches that whole value."""
+        now = datetime.now(timezone.utc)
+        entries = [
+            MetadataEntry(
+                bucket="test-bucket",
+                original_file_key=f"docs/file{i}.pdf",
+                metadata_file_key=f"docs/file{i}.pdf.metadata.json",
+                last_modified=now,
+                file_size=10,
+                metadata={"department": department},
+            )
+            for i, department in enumerate(["Sales", "S", "Engineering"])
+        ]
+        collector = MetadataCollector(s3_operations=mock_s3_operations)
+
+        def apply(metadata_filters):
+            params = CollectionParams(**base_params_kwargs, metadata_filters=metadata_filters)
+            return [
+                entry.metadata["department"] for entry in collector._apply_filters(entries, params)
+            ]
+
+        assert apply({"department": "Sales"}) == ["Sales"]
+        assert apply({"department": "S"}) == ["S"]
+        assert apply({"department": "ales"}) == []
+
+    def test_aggregation(self, mock_s3_operations, base_params_kwargs):
         """Test result aggregation."""
         collector = MetadataCollector(s3_operations=mock_s3_operations)
 
-        params = CollectionParams(
-            bucket_name="test-bucket",
-            start_date=datetime.now(timezone.utc) - timedelta(days=1),
-            end_date=datetime.now(timezone.utc),
-        )
+        params = CollectionParams(**base_params_kwargs)
 
         result = collector.collect(params)
         aggregation = result.aggregate()
@@ -135,11 +205,11 @@ class TestMetadataEntry:
 
     def test_from_s3_metadata(self):
         """Test MetadataEntry construction from S3 metadata."""
-        file_info = {
-            "Key": "reports/test.pdf.metadata.json",
-            "LastModified": datetime.now(timezone.utc),
-            "Size": 1024,
-        }
+        file_info = S3ObjectInfo(
+            key="reports/test.pdf.metadata.json",
+            last_modified=datetime.now(timezone.utc),
+            size=1024,
+        )
 
         metadata_content = {
             "department": "Engineering",
@@ -149,7 +219,7 @@ class TestMetadataEntry:
 
         entry = MetadataEntry.from_s3_metadata(
             bucket="test-bucket",
-            metadata_file_key=file_info["Key"],
+            metadata_file_key=file_info.key,
             file_info=file_info,
             metadata_content=metadata_content,
         )
@@ -192,3 +262,75 @@ class TestMetadataEntry:
         assert result["s3_info"]["bucket"] == "test-bucket"
         assert result["s3_info"]["file_extension"] == "pdf"
         assert result["metadata"]["department"] == "Sales"
+
+
+class TestCollectionResult:
+    """Test cases for CollectionResult aggregation."""
+
+    @staticmethod
+    def _make_result(metadata_list):
+        """Build a CollectionResult from a list of metadata dicts."""
+        now = datetime.now(timezone.utc)
+        entries = [
+            MetadataEntry(
+                bucket="test-bucket",
+                original_file_key=f"docs/file{i}.pdf",
+                metadata_file_key=f"docs/file{i}.pdf.metadata.json",
+                last_modified=now,
+                file_size=100,
+                metadata=metadata,
+            )
+            for i, metadata in enumerate(metadata_list)
+        ]
+        return CollectionResult(
+            entries=entries,
+            total_scanned=len(entries),
+            total_collected=len(entries),
+            execution_time_seconds=0.1,
+            data_transfer_bytes=100 * len(entries),
+        )
+
+    def test_aggregate_schema_and_values(self):
+        """Test schema, numeric stats, list values and top-10 + others."""
+        metadata_list = [
+            {"pages": i + 1, "tags": ["a", "b"], "category": f"cat{i % 12}", "note": None}
+            for i in range(24)
+        ]
+        result = self._make_result(metadata_list)
+
+        aggregation = result.aggregate()
+        schema = aggregation["schema"]
+        aggs = aggregation["aggregations"]
+
+        assert "note" not in schema  # Only null values
+        assert schema["pages"]["is_numeric"] is True
+        assert schema["tags"]["is_numeric"] is False
+        assert schema["category"]["null_count"] == 0
+
+        assert aggs["pages"] == {"count": 24, "min": 1, "max": 24, "avg": 12.5, "sum": 300}
+        assert aggs["tags"] == {"a": 24, "b": 24}
+        assert len(aggs["category"]) == 11
+        assert aggs["category"]["_others"] == 4
+        assert aggregation["by_file_type"] == {"pdf": 24}
+
+    def test_mixed_types_are_categorical(self):
+        """Test that a field with numeric and text values is counted as text."""
+        result = self._make_result([{"size": 1}, {"size": "large"}, {"size": 1}, {}])
+
+        aggregation = result.aggregate()
+
+        assert aggregation["schema"]["size"]["is_numeric"] is False
+        assert aggregation["schema"]["size"]["null_count"] == 1
+        assert aggregation["aggregations"]["size"] == {"1": 2, "large": 1}
+
+    def test_mixed_type_ties_keep_encounter_order(self):
+        """Test that tied counts in mixed fields rank values in first-seen order."""
+        values = [1, "a", "b", "c", 2.5, "d", "e", "f", "g", "h", "i"]
+        result = self._make_result([{"mixed": value} for value in values])
+
+        aggregation = result.aggregate()
+
+        # The numeric values 1 and 2.5 rank where they appear, not after the strings
+        expected = [str(value) for value in values[:10]] + ["_others"]
+        assert list(aggregation["aggregations"]["mixed"]) == expected
+        assert aggregation["aggregations"]["mixed"]["_others"] == 1
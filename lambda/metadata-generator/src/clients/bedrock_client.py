@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from typing import Any
 
 import boto3
@@ -10,6 +11,12 @@ import boto3
 from ..services.json_extractor import JsonExtractor
 
 
+@lru_cache(maxsize=1)
+def _default_bedrock_runtime():
+    """Create the Bedrock Runtime client shared by BedrockClient instances."""
+    return boto3.client("bedrock-runtime")
+
+
 class BedrockClient:
     """Client for Amazon Bedrock API."""
 
@@ -27,12 +34,19 @@ class BedrockClient:
             model_id: Bedrock model ID to use
             max_tokens: Maximum tokens to generate
             temperature: Temperature for generation (0.0 to 1.0)
-            bedrock_client: Optional boto3 Bedrock Runtime client
+            bedrock_client: Optional boto3 Bedrock Runtime client. If not provided,
+                a shared default client is used.
         """
         self.model_id = model_id
         self.max_tokens = max_tokens
         self.temperature = temperature
-        self.bedrock_client = bedrock_client or boto3.client("bedrock-runtime")
+        self.bedrock_client = bedrock_client or _default_bedrock_runtime()
+
+        # Inference settings are the same for every Converse call
+        self._inference_config = {"maxTokens": max_tokens, "temperature": temperature}
+
+        # (tool_name, tool_description) -> (json_schema, tool_config) of the last call
+        self._tool_config_cache: dict[tuple[str, str], tuple[dict[str, Any], dict[str, Any]]] = {}
 
     def generate_structured_json(
         self,
@@ -60,26 +74,14 @@ class BedrockClient:
             Exception: If generation fails or no tool use is returned
         """
         try:
-            # Prepare tool configuration
-            tool_config = {
-                "tools": [
-                    {
-                        "toolSpec": {
-                            "name": tool_name,
-                            "description": tool_description,
-                            "inputSchema": {"json": json_schema},
-                        }
-                    }
-                ],
-                "toolChoice": {"tool": {"name": tool_name}},
-            }
+            tool_config = self._get_tool_config(json_schema, tool_name, tool_description)
 
             # Call Converse API
             response = self.bedrock_client.converse(
                 modelId=self.model_id,
                 messages=[{"role": "user", "content": [{"text": prompt}]}],
                 toolConfig=tool_config,
-                inferenceConfig={"maxTokens": self.max_tokens, "temperature": self.temperature},
+                inferenceConfig=self._inference_config,
             )
 
             # Extract tool use from response
@@ -94,12 +96,11 @@ class BedrockClient:
             if "content" not in message:
                 raise ValueError("No content in Bedrock message")
 
-            # Find tool use in content
-            tool_use = None
-            for content_block in message["content"]:
-                if "toolUse" in content_block:
-                    tool_use = content_block["toolUse"]
-                    break
+            # Find tool use in content; with a forced tool choice it is normally the last block
+            content = message["content"]
+            tool_use = content[-1].get("toolUse") if content else None
+            if tool_use is None:
+                tool_use = next((block["toolUse"] for block in content if "toolUse" in block), None)
 
             if not tool_use:
                 raise ValueError("No tool use found in response")
@@ -113,6 +114,41 @@ class BedrockClient:
         except Exception as e:
             raise Exception(f"Failed to generate structured JSON with Bedrock: {str(e)}") from e
 
+    def _get_tool_config(
+        self, json_schema: dict[str, Any], tool_name: str, tool_description: str
+    ) -> dict[str, Any]:
+        """
+        Get the Converse tool configuration, reusing it while the same schema is passed.
+
+        Args:
+            json_schema: JSON Schema defining the structure of the output
+            tool_name: Name of the tool
+            tool_description: Description of what the tool does
+
+        Returns:
+            Tool configuration forcing the model to use the tool
+        """
+        cache_key = (tool_name, tool_description)
+        cached = self._tool_config_cache.get(cache_key)
+        # Identity check: the cache holds a reference, so the schema cannot be a recycled object
+        if cached is not None and cached[0] is json_schema:
+            return cached[1]
+
+        tool_config = {
+            "tools": [
+                {
+                    "toolSpec": {
+                        "name": tool_name,
+                        "description": tool_description,
+                        "inputSchema": {"json": json_schema},
+                    }
+                }
+            ],
+            "toolChoice": {"tool": {"name": tool_name}},
+        }
+        self._tool_config_cache[cache_key] = (json_schema, tool_config)
+        return tool_config
+
     def generate_metadata(
         self, prompt: str, json_schema: dict[str, Any] | None = None
     ) -> dict[str, Any]:
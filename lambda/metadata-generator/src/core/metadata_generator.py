@@ -7,6 +7,14 @@ from ..services.prompt_builder import PromptBuilder
 from ..services.rule_matcher import RuleMatcher
 from .schema import Config, FileInfo, GeneratedMetadata
 
+# Metadata field type -> JSON schema type
+FIELD_TYPE_MAPPING = {
+    "STRING": "string",
+    "STRING_LIST": "array",
+    "NUMBER": "number",
+    "BOOLEAN": "boolean",
+}
+
 
 class MetadataGenerator:
     """Generate metadata for files based on configured rules."""
@@ -24,6 +32,9 @@ class MetadataGenerator:
         self.bedrock_client = bedrock_client
         self.rule_matcher = rule_matcher
 
+        # The schema depends only on the configuration, so every file shares one instance
+        self._json_schema = self._build_json_schema()
+
     def generate_metadata(self, file_info: FileInfo) -> GeneratedMetadata:
         """
         Generate metadata for a file.
@@ -42,8 +53,8 @@ class MetadataGenerator:
             # Extract path-based metadata (highest priority)
             path_metadata = self.rule_matcher.extract_values(file_info.key, rule)
 
-        # Build JSON schema from metadata fields for AI generation
-        json_schema = self._build_json_schema()
+        # JSON schema from metadata fields for AI generation
+        json_schema = self._json_schema
 
         # Calculate max content characters based on input context window
         max_content_chars = PromptBuilder.calculate_max_content_chars(
@@ -98,10 +109,4 @@ class MetadataGenerator:
 
     def _convert_field_type(self, field_type: str) -> str:
         """Convert metadata field type to JSON schema type."""
-        type_mapping = {
-            "STRING": "string",
-            "STRING_LIST": "array",
-            "NUMBER": "number",
-            "BOOLEAN": "boolean"
-        }
-        return type_mapping.get(field_type, "string")
+        return FIELD_TYPE_MAPPING.get(field_type, "string")
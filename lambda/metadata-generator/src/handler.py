@@ -15,6 +15,20 @@ from .services.rule_matcher import RuleMatcher
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+
+class _LazyJSON:
+    """Defer json.dumps until a log record is actually formatted."""
+
+    __slots__ = ("obj", "kwargs")
+
+    def __init__(self, obj: Any, **kwargs: Any):
+        self.obj = obj
+        self.kwargs = kwargs
+
+    def __str__(self) -> str:
+        return json.dumps(self.obj, **self.kwargs)
+
+
 try:
     # Load configuration
     config = ConfigLoader.load_from_module()
@@ -62,7 +76,7 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         Response dictionary with status and details
     """
     try:
-        logger.info(f"Processing event: {json.dumps(event)}")
+        logger.info("Processing event: %s", _LazyJSON(event))
 
         # Extract file information from EventBridge event (delegated to EventParser)
         file_info = EventParser.extract_file_info(event)
@@ -93,7 +107,8 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
 
         # Log generated metadata
         logger.info(
-            f"Generated metadata: {json.dumps(metadata.metadata, ensure_ascii=False, indent=2)}"
+            "Generated metadata: %s",
+            _LazyJSON(metadata.metadata, ensure_ascii=False, indent=2),
         )
 
         # Save metadata to S3
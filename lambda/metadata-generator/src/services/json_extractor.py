@@ -4,6 +4,108 @@ import json
 import re
 from typing import Any
 
+# Decoder and whitespace skipper for parsing the whole text in place
+_DECODER = json.JSONDecoder()
+_WHITESPACE_RE = re.compile(r"\s*")
+
+# JSON string literal, including escaped quotes, starting at an opening quote
+_STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+
+# Inside an object a string follows one of these, and is followed by one of the others
+_BEFORE_STRING = frozenset("{[,:")
+_AFTER_STRING = frozenset(":,]}")
+
+# JSON object inside a markdown code block, with or without a language tag
+_CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+
+def _string_end(text: str, start: int) -> int | None:
+    """
+    Return the index after the JSON string opening at start.
+
+    Args:
+        text: Text being scanned
+        start: Index of the opening quote
+
+    Returns:
+        Index after the closing quote, or None if the quote does not open a
+        string that JSON could accept at this position
+    """
+    match = _STRING_RE.match(text, start)
+    if match is None:
+        return None
+    end = match.end()
+    following = _WHITESPACE_RE.match(text, end).end()
+    if following < len(text) and text[following] not in _AFTER_STRING:
+        return None
+    return end
+
+
+def _find_object_spans(text: str) -> list[tuple[int, int]]:
+    """
+    Find the outermost balanced {...} spans in text in a single forward scan.
+
+    Quotes only open a string inside a brace and where JSON expects a string.
+    A quote whose string would not be followed by ":", ",", "]" or "}" is read
+    as prose, so the characters it would have swallowed are still scanned for
+    braces. Those characters contain no unescaped quote, so each character is
+    scanned at most twice.
+
+    Args:
+        text: Text that may contain JSON objects
+
+    Returns:
+        (start, end) index pairs of the outermost balanced spans
+    """
+    open_braces: list[int] = []
+    spans: list[tuple[int, int]] = []
+    previous = ""
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if ch == '"' and open_braces and previous in _BEFORE_STRING:
+            end = _string_end(text, i)
+            if end is not None:
+                previous = ch
+                i = end
+                continue
+        elif ch == "{":
+            open_braces.append(i)
+        elif ch == "}" and open_braces:
+            start = open_braces.pop()
+            # Drop the spans nested inside this one
+            while spans and spans[-1][0] > start:
+                spans.pop()
+            spans.append((start, i + 1))
+        if not ch.isspace():
+            previous = ch
+        i += 1
+    return spans
+
+
+def _find_longest_json_object(text: str) -> dict[str, Any] | None:
+    """
+    Decode the JSON objects embedded in text and return the longest one.
+
+    Only the outermost balanced spans are decoded, longest first. Each span is
+    decoded on its own so a failure costs time proportional to the span.
+
+    Args:
+        text: Text that may contain JSON objects
+
+    Returns:
+        The longest decoded object, or None if no object could be decoded
+    """
+    spans = _find_object_spans(text)
+    for start, end in sorted(spans, key=lambda span: span[0] - span[1]):
+        try:
+            obj = json.loads(text[start:end])
+        except (json.JSONDecodeError, RecursionError):
+            continue
+        if isinstance(obj, dict):
+            return obj
+    return None
+
 
 class JsonExtractor:
     """Extract and parse JSON from generated text."""
@@ -27,15 +129,19 @@ class JsonExtractor:
         Raises:
             ValueError: If no valid JSON found
         """
-        # Try to parse the entire text as JSON first
+        # Try to parse the entire text as JSON first, skipping surrounding
+        # whitespace in place instead of copying a stripped string
+        start = _WHITESPACE_RE.match(text).end()
         try:
-            return json.loads(text.strip())
-        except json.JSONDecodeError:
+            result, end = _DECODER.raw_decode(text, start)
+        except (json.JSONDecodeError, RecursionError):
             pass
+        else:
+            if _WHITESPACE_RE.match(text, end).end() == len(text):
+                return result
 
         # Try to find JSON in markdown code blocks
-        json_pattern = r"```(?:json)?\s*(\{.*?\})\s*```"
-        matches = re.findall(json_pattern, text, re.DOTALL)
+        matches = _CODE_BLOCK_RE.findall(text)
 
         if matches:
             for match in matches:
@@ -44,16 +150,9 @@ class JsonExtractor:
                 except json.JSONDecodeError:
                     continue
 
-        # Try to find JSON object directly in text
-        json_obj_pattern = r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}"
-        matches = re.findall(json_obj_pattern, text, re.DOTALL)
-
-        if matches:
-            # Try the longest match first (likely to be the complete JSON)
-            for match in sorted(matches, key=len, reverse=True):
-                try:
-                    return json.loads(match)
-                except json.JSONDecodeError:
-                    continue
+        # Try to find JSON object directly in text; the longest one is likely the complete JSON
+        result = _find_longest_json_object(text)
+        if result is not None:
+            return result
 
         raise ValueError(f"No valid JSON found in generated text: {text[:200]}...")
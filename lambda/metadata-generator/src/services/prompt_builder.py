@@ -60,31 +60,31 @@ class PromptBuilder:
             desc = field_schema.get("description", "")
             field_type = field_schema.get("type", "string")
 
-            field_info = f"- {field_name} ({field_type})"
+            parts = [f"- {field_name} ({field_type})"]
             if field_name in required_fields:
-                field_info += " [Required]"
+                parts.append(" [Required]")
             if desc:
-                field_info += f": {desc}"
+                parts.append(f": {desc}")
 
             # Add enum values if present
             if "enum" in field_schema:
                 enum_values = ", ".join(str(v) for v in field_schema["enum"])
-                field_info += f"\n  Options: {enum_values}"
+                parts.append(f"\n  Options: {enum_values}")
 
             # Add const value if present
             if "const" in field_schema:
-                field_info += f"\n  Fixed value: {field_schema['const']}"
+                parts.append(f"\n  Fixed value: {field_schema['const']}")
 
             # Add array item info if present
             if field_type == "array" and "items" in field_schema:
                 items_type = field_schema["items"].get("type", "string")
-                field_info += f"\n  Array items: {items_type}"
+                parts.append(f"\n  Array items: {items_type}")
                 if "minItems" in field_schema:
-                    field_info += f", minimum {field_schema['minItems']} items"
+                    parts.append(f", minimum {field_schema['minItems']} items")
                 if "maxItems" in field_schema:
-                    field_info += f", maximum {field_schema['maxItems']} items"
+                    parts.append(f", maximum {field_schema['maxItems']} items")
 
-            field_descriptions.append(field_info)
+            field_descriptions.append("".join(parts))
 
         # Limit content length for prompt
         content_preview = file_info.content[:max_content_chars]
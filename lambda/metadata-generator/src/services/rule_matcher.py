@@ -1,10 +1,33 @@
 """Match files against pattern rules."""
 
 import re
+from functools import lru_cache
 
 from ..core.schema import PathRule
 
 
+@lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> re.Pattern:
+    """Compile a glob pattern (with {var} wildcards) into a matching regex."""
+    # Replace {variable} with * for glob matching
+    glob_pattern = re.sub(r'\{[^}]+\}', '*', pattern)
+
+    # Convert glob pattern to regex - handle ** before * to avoid conflicts
+    regex_pattern = glob_pattern.replace('**', 'DOUBLESTAR_PLACEHOLDER')
+    regex_pattern = regex_pattern.replace('*', '[^/]*')
+    regex_pattern = regex_pattern.replace('DOUBLESTAR_PLACEHOLDER', '.*')
+
+    return re.compile(f'^{regex_pattern}$')
+
+
+@lru_cache(maxsize=256)
+def _compile_extraction(pattern: str) -> re.Pattern:
+    """Compile a rule pattern into a regex with a named group per {var}."""
+    regex_pattern = pattern.replace('**', '.*').replace('*', '[^/]*')
+    regex_pattern = re.sub(r'\{(\w+)\}', r'(?P<\1>[^/]+)', regex_pattern)
+    return re.compile(f'^{regex_pattern}$')
+
+
 class RuleMatcher:
     """Match files against pattern rules using glob patterns."""
 
@@ -20,11 +43,8 @@ class RuleMatcher:
 
     def extract_values(self, file_key: str, rule: PathRule) -> dict[str, str]:
         """Extract values from file path using rule pattern."""
-        # Convert pattern to regex for value extraction
-        regex_pattern = rule.pattern.replace('**', '.*').replace('*', '[^/]*')
-        regex_pattern = re.sub(r'\{(\w+)\}', r'(?P<\1>[^/]+)', regex_pattern)
-        
-        match = re.match(f'^{regex_pattern}$', file_key)
+        # Pattern regexes are compiled once per rule and reused for every file
+        match = _compile_extraction(rule.pattern).match(file_key)
         extracted = match.groupdict() if match else {}
         
         # Apply rule extractions (fixed values override path values)
@@ -40,12 +60,4 @@ class RuleMatcher:
     @staticmethod
     def match_pattern(file_key: str, pattern: str) -> bool:
         """Check if file matches glob pattern, treating {var} as wildcards."""
-        # Replace {variable} with * for glob matching
-        glob_pattern = re.sub(r'\{[^}]+\}', '*', pattern)
-        
-        # Convert glob pattern to regex - handle ** before * to avoid conflicts
-        regex_pattern = glob_pattern.replace('**', 'DOUBLESTAR_PLACEHOLDER')
-        regex_pattern = regex_pattern.replace('*', '[^/]*')
-        regex_pattern = regex_pattern.replace('DOUBLESTAR_PLACEHOLDER', '.*')
-        
-        return bool(re.match(f'^{regex_pattern}$', file_key))
+        return bool(_compile_glob(pattern).match(file_key))
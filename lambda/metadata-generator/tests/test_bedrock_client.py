@@ -0,0 +1,61 @@
+"""Tests for Bedrock client structured generation."""
+
+from unittest.mock import MagicMock
+
+from src.clients.bedrock_client import BedrockClient
+
+
+def _converse_response(tool_input: dict) -> dict:
+    """Build a Converse API response containing a single tool use."""
+    return {
+        "output": {
+            "message": {
+                "role": "assistant",
+                "content": [{"toolUse": {"toolUseId": "1", "name": "t", "input": tool_input}}],
+            }
+        }
+    }
+
+
+def test_tool_config_reused_for_same_schema():
+    """Test that the tool configuration is built once per schema instance."""
+    mock_bedrock = MagicMock()
+    mock_bedrock.converse.return_value = _converse_response({"title": "Report"})
+    client = BedrockClient(bedrock_client=mock_bedrock)
+    schema = {"type": "object", "properties": {"title": {"type": "string"}}}
+
+    assert client.generate_metadata("first", json_schema=schema) == {"title": "Report"}
+    client.generate_metadata("second", json_schema=schema)
+
+    first_call, second_call = mock_bedrock.converse.call_args_list
+    assert first_call.kwargs["toolConfig"] is second_call.kwargs["toolConfig"]
+    tool_spec = first_call.kwargs["toolConfig"]["tools"][0]["toolSpec"]
+    assert tool_spec["inputSchema"]["json"] is schema
+
+
+def test_tool_config_rebuilt_for_new_schema():
+    """Test that a different schema instance gets its own tool configuration."""
+    mock_bedrock = MagicMock()
+    mock_bedrock.converse.return_value = _converse_response({})
+    client = BedrockClient(bedrock_client=mock_bedrock)
+
+    client.generate_metadata("first", json_schema={"type": "object", "properties": {}})
+    new_schema = {"type": "object", "properties": {"author": {"type": "string"}}}
+    client.generate_metadata("second", json_schema=new_schema)
+
+    second_call = mock_bedrock.converse.call_args_list[1]
+    tool_spec = second_call.kwargs["toolConfig"]["tools"][0]["toolSpec"]
+    assert tool_spec["inputSchema"]["json"] is new_schema
+
+
+def test_tool_use_found_before_trailing_text():
+    """Test that tool use is found when it is not the last content block."""
+    mock_bedrock = MagicMock()
+    response = _converse_response({"title": "Report"})
+    response["output"]["message"]["content"].append({"text": "Done."})
+    mock_bedrock.converse.return_value = response
+    client = BedrockClient(bedrock_client=mock_bedrock)
+
+    result = client.generate_metadata("prompt", json_schema={"type": "object"})
+
+    assert result == {"title": "Report"}
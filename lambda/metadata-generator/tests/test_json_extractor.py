@@ -1,5 +1,7 @@
 """Unit tests for JsonExtractor."""
 
+import time
+
 import pytest
 
 from src.services.json_extractor import JsonExtractor
@@ -73,6 +75,30 @@ def test_extract_nested_json():
     assert result == {"outer": {"inner": {"name": "test", "value": 123}}}
 
 
+def test_extract_deeply_nested_json_from_mixed_text():
+    """Test extracting a multi-level object with braces in strings from prose."""
+    text = 'Result: {"outer": {"inner": {"pattern": "{name}"}}} Done. {'
+    result = JsonExtractor.extract_json(text)
+
+    assert result == {"outer": {"inner": {"pattern": "{name}"}}}
+
+
+def test_extract_json_after_stray_quote_and_brace():
+    """Test extracting JSON when the prose has a quoted stray brace."""
+    text = 'He said "quote {" and {"a": {"b": 2}}'
+    result = JsonExtractor.extract_json(text)
+
+    assert result == {"a": {"b": 2}}
+
+
+def test_extract_json_after_unclosed_brace_and_quote():
+    """Test extracting JSON when the prose has an unclosed brace and quote."""
+    text = 'Use {braces like "this} and then {"a": 1}'
+    result = JsonExtractor.extract_json(text)
+
+    assert result == {"a": 1}
+
+
 def test_extract_json_with_arrays():
     """Test extracting JSON with arrays."""
     text = '{"items": [1, 2, 3], "tags": ["a", "b", "c"]}'
@@ -134,3 +160,21 @@ def test_empty_string_raises_error():
         JsonExtractor.extract_json("")
 
     assert "No valid JSON found" in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"a":' * 20000,
+        '{"a":[' * 20000,
+        "pre " + '{"k": 1, "s": "' * 20000,
+        '{"' * 50000,
+    ],
+)
+def test_unbalanced_input_is_rejected_in_linear_time(text):
+    """Test that many unclosed objects are rejected without rescanning the text."""
+    start = time.perf_counter()
+    with pytest.raises(ValueError):
+        JsonExtractor.extract_json(text)
+
+    assert time.perf_counter() - start < 1.0